@@ -6,10 +6,368 @@ organizing files into directory structures based on location data.
 """
 
 import os
+import errno
+import functools
+import hashlib
+import json
+import queue
+import re
 import shutil
+import stat
+import sys
 import logging
+import mmap
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict
+from typing import Optional, Tuple, List, Dict, Iterator
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+# Supported media extensions (lowercase, with leading dot)
+MEDIA_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp',
+    '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp'
+})
+
+# Same extensions without the dot, for matching against slices of entry names
+_MEDIA_EXTS = frozenset(ext[1:] for ext in MEDIA_EXTENSIONS)
+
+class FileRecord(str):
+    """
+    Path of a scanned media file, carrying the size, mtime and device seen during the scan.
+    
+    Behaves exactly like the path string, so it can be passed anywhere a
+    path is expected; file operations use the cached values to avoid
+    repeating stat() calls. A dev of 0 means the device is not known
+    (os.DirEntry.stat() leaves it unset on Windows).
+    """
+    
+    __slots__ = ('size', 'mtime_ns', 'dev')
+    
+    def __new__(cls, path: str, size: int, mtime_ns: int, dev: int = 0):
+        record = super().__new__(cls, path)
+        record.size = size
+        record.mtime_ns = mtime_ns
+        record.dev = dev
+        return record
+    
+    @property
+    def path(self) -> str:
+        """Plain string path of the file."""
+        return str(self)
+
+
+# Hash function behind content digests, recorded in the persisted index
+DIGEST_ALGORITHM = 'blake3' if BLAKE3_AVAILABLE else 'blake2b'
+
+# Name of the persisted destination content index
+INDEX_FILENAME = '.media_organizer_index.json'
+
+# Read size used when comparing two files byte for byte
+COMPARE_BUFFER_SIZE = 1 << 20
+
+# Files at least this large are fingerprinted from head, middle and tail
+# samples before a full comparison
+SIGNATURE_MIN_SIZE = 16 << 20
+SIGNATURE_SAMPLE_SIZE = 1 << 20
+
+# Files at least this large are memory-mapped when hashed
+MMAP_MIN_SIZE = 1 << 20
+
+# Walk with directory file descriptors where supported, so per-file stat
+# calls resolve names relative to the open directory
+FWALK_AVAILABLE = hasattr(os, 'fwalk') and sys.platform != 'win32'
+
+# Destination file names are compared case-insensitively on platforms
+# whose default filesystems are case-insensitive
+if sys.platform in ('win32', 'darwin'):
+    _name_key = str.lower
+else:
+    def _name_key(name: str) -> str:
+        return name
+
+# Files smaller than this are copied without posix_fadvise hints
+FADVISE_MIN_SIZE = 1 << 20
+
+# Metadata can be copied through open descriptors (Linux)
+FD_METADATA_AVAILABLE = (os.utime in os.supports_fd and os.chmod in os.supports_fd
+                         and hasattr(os, 'listxattr'))
+
+# FICLONE ioctl: share the source's data blocks (reflink) on copy-on-write
+# filesystems such as Btrfs and XFS
+FICLONE = 0x40049409
+try:
+    import fcntl
+    FICLONE_AVAILABLE = sys.platform.startswith('linux')
+except ImportError:
+    FICLONE_AVAILABLE = False
+
+# posix_fadvise hints are only applied on Linux, where they are honoured
+FADVISE_AVAILABLE = sys.platform.startswith('linux') and hasattr(os, 'posix_fadvise')
+
+# os.link errors meaning the filesystem cannot hard link the file, so a
+# move falls back to copying
+_LINK_UNSUPPORTED_ERRNOS = frozenset({
+    errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP,
+    getattr(errno, 'EOPNOTSUPP', errno.ENOTSUP),
+})
+
+# os.sendfile into a regular file with a None offset is Linux-only; macOS
+# and the BSDs need an int offset and a socket as the output
+SENDFILE_AVAILABLE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
+
+def _fadvise(fd: int, size: int, advice: str) -> None:
+    """
+    Give the kernel an access-pattern hint for a file, if supported.
+    
+    Args:
+        fd: Open file descriptor
+        size: Length of the region (from offset 0) the hint applies to
+        advice: Name of the os.POSIX_FADV_* constant to apply
+    """
+    if not FADVISE_AVAILABLE:
+        return
+    try:
+        os.posix_fadvise(fd, 0, size, getattr(os, advice))
+    except OSError:
+        pass
+
+
+# Translation table replacing characters invalid in file names
+_INVALID_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Runs of whitespace collapsed to a single space in sanitized names
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# English names for common Hindi location names
+_HINDI_MAPPINGS = {
+    'नई दिल्ली': 'New Delhi',
+    'मुंबई': 'Mumbai',
+    'कोलकाता': 'Kolkata',
+    'चेन्नई': 'Chennai',
+    'बैंगलोर': 'Bangalore',
+    'हैदराबाद': 'Hyderabad',
+    'अहमदाबाद': 'Ahmedabad',
+    'पुणे': 'Pune',
+    'जयपुर': 'Jaipur',
+    'लखनऊ': 'Lucknow',
+    'कानपुर': 'Kanpur',
+    'नागपुर': 'Nagpur',
+    'इंदौर': 'Indore',
+    'थाणे': 'Thane',
+    'भोपाल': 'Bhopal',
+    'विशाखापत्तनम': 'Visakhapatnam',
+    'पटना': 'Patna',
+    'वडोदरा': 'Vadodara',
+    'घाटकोपर': 'Ghatkopar',
+    'लुधियाना': 'Ludhiana',
+    'आगरा': 'Agra',
+    'नाशिक': 'Nashik',
+    'फरीदाबाद': 'Faridabad',
+    'मेरठ': 'Meerut',
+    'राजकोट': 'Rajkot',
+    'कलकत्ता': 'Kolkata',
+    'मद्रास': 'Chennai',
+    'बॉम्बे': 'Mumbai',
+    'दिल्ली': 'Delhi',
+    'महाराष्ट्र': 'Maharashtra',
+    'पश्चिम बंगाल': 'West Bengal',
+    'तमिलनाडु': 'Tamil Nadu',
+    'कर्नाटक': 'Karnataka',
+    'उत्तर प्रदेश': 'Uttar Pradesh',
+    'मध्य प्रदेश': 'Madhya Pradesh',
+    'गुजरात': 'Gujarat',
+    'राजस्थान': 'Rajasthan',
+    'पंजाब': 'Punjab',
+    'हरियाणा': 'Haryana',
+    'बिहार': 'Bihar',
+    'झारखंड': 'Jharkhand',
+    'ओडिशा': 'Odisha',
+    'छत्तीसगढ़': 'Chhattisgarh',
+    'तेलंगाना': 'Telangana',
+    'आंध्र प्रदेश': 'Andhra Pradesh',
+    'केरल': 'Kerala',
+    'गोवा': 'Goa',
+}
+
+# English names for common Arabic location names
+_ARABIC_MAPPINGS = {
+    # Qatar cities and country
+    'الدوحة': 'Doha',
+    'الوكرة': 'Al Wakrah',
+    'الخور': 'Al Khor',
+    'الريان': 'Al Rayyan',
+    'أم صلال': 'Umm Salal',
+    'الظعاين': 'Al Daayen',
+    'الشحانية': 'Al Shamal',
+    'قطر': 'Qatar',
+    # UAE cities and country
+    'دبي': 'Dubai',
+    'أبو ظبي': 'Abu Dhabi',
+    'الشارقة': 'Sharjah',
+    'العين': 'Al Ain',
+    'أم القيوين': 'Umm Al Quwain',
+    'رأس الخيمة': 'Ras Al Khaimah',
+    'الفجيرة': 'Fujairah',
+    'عجمان': 'Ajman',
+    'الإمارات': 'United Arab Emirates',
+    # Kuwait cities and country
+    'الكويت': 'Kuwait City',
+    'حولي': 'Hawally',
+    'الجهراء': 'Al Jahra',
+    'مبارك الكبير': 'Mubarak Al Kabeer',
+    'الأحمدي': 'Al Ahmadi',
+    'الفروانية': 'Al Farwaniyah',
+    # Bahrain cities and country
+    'المنامة': 'Manama',
+    'المحرق': 'Muharraq',
+    'الرفاع': 'Riffa',
+    'مدينة عيسى': 'Isa Town',
+    'مدينة حمد': 'Hamad Town',
+    'الدراز': 'Dar Kulaib',
+    'البحرين': 'Bahrain',
+    # Oman cities and country
+    'مسقط': 'Muscat',
+    'صلالة': 'Salalah',
+    'صحار': 'Sohar',
+    'نزوى': 'Nizwa',
+    'البريمي': 'Al Buraimi',
+    'صور': 'Sur',
+    # 'عمان' is both Oman and Amman; it maps to Amman here and to Oman
+    # when it is the country name (see _COUNTRY_MAPPINGS)
+    # Jordan cities and country
+    'عمان': 'Amman',
+    'إربد': 'Irbid',
+    'الزرقاء': 'Zarqa',
+    'العقبة': 'Aqaba',
+    'السلط': 'Salt',
+    'الكرك': 'Karak',
+    'الأردن': 'Jordan',
+    # Lebanon cities and country
+    'بيروت': 'Beirut',
+    'طرابلس': 'Tripoli',
+    'صيدا': 'Sidon',
+    'بعلبك': 'Baalbek',
+    'جبيل': 'Byblos',
+    'زحلة': 'Zahle',
+    'لبنان': 'Lebanon',
+    # Syria cities and country
+    'دمشق': 'Damascus',
+    'حلب': 'Aleppo',
+    'حمص': 'Homs',
+    'حماة': 'Hama',
+    'اللاذقية': 'Latakia',
+    'دير الزور': 'Deir ez-Zor',
+    'سوريا': 'Syria',
+    # Iraq cities and country
+    'بغداد': 'Baghdad',
+    'البصرة': 'Basra',
+    'الموصل': 'Mosul',
+    'أربيل': 'Erbil',
+    'السليمانية': 'Sulaymaniyah',
+    'النجف': 'Najaf',
+    'العراق': 'Iraq',
+    # Yemen cities and country
+    'صنعاء': 'Sanaa',
+    'عدن': 'Aden',
+    'تعز': 'Taiz',
+    'الحديدة': 'Al Hudaydah',
+    'إب': 'Ibb',
+    'ذمار': 'Dhamar',
+    'اليمن': 'Yemen',
+    # Saudi cities and country
+    'الرياض': 'Riyadh',
+    'جدة': 'Jeddah',
+    'مكة': 'Makkah',
+    'المدينة': 'Madinah',
+    'الدمام': 'Dammam',
+    'الخبر': 'Khobar',
+    'الظهران': 'Dhahran',
+    'تبوك': 'Tabuk',
+    'حائل': 'Hail',
+    'بريدة': 'Buraidah',
+    'الطائف': 'Taif',
+    'أبها': 'Abha',
+    'جازان': 'Jazan',
+    'نجران': 'Najran',
+    'الجوف': 'Jouf',
+    'السعودية': 'Saudi Arabia',
+    # Egypt
+    'مصر': 'Egypt',
+    'القاهرة': 'Cairo',
+    'الإسكندرية': 'Alexandria',
+    'الأقصر': 'Luxor',
+    'أسوان': 'Aswan',
+    'شرم الشيخ': 'Sharm El Sheikh',
+}
+
+# Single lookup table for all transliterated names
+_NAME_MAPPINGS = {**_HINDI_MAPPINGS, **_ARABIC_MAPPINGS}
+
+# Names that mean something else when used as the country
+_COUNTRY_MAPPINGS = {
+    'عمان': 'Oman',
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_filename_cached(filename: str) -> str:
+    """
+    Sanitize a filename for filesystem compatibility.
+    
+    Location names repeat heavily across a media library, so results are
+    memoized.
+    
+    Args:
+        filename: Original filename
+        
+    Returns:
+        Sanitized filename
+    """
+    # Replace invalid characters in a single pass
+    filename = filename.translate(_INVALID_TRANS)
+    
+    # Plain ASCII names (the common case) need neither a mapping nor
+    # transliteration; all mapped names are non-ASCII
+    if not filename.isascii():
+        # First, try to find a mapping for the original name (trim whitespace first)
+        english_name = _NAME_MAPPINGS.get(filename.strip())
+        if english_name is not None:
+            filename = english_name
+        else:
+            # Transliterate to ASCII: normalize unicode characters, then drop
+            # what has no ASCII equivalent
+            filename = unicodedata.normalize('NFKD', filename)
+            filename = filename.encode('ascii', 'ignore').decode('ascii')
+            if not filename.strip():
+                filename = "Location"
+    elif not filename.strip():
+        filename = "Location"
+    
+    # Remove leading/trailing spaces and dots
+    filename = filename.strip('. ')
+    
+    # Replace multiple spaces with single space
+    filename = _WHITESPACE_RE.sub(' ', filename)
+    
+    # Limit length
+    if len(filename) > 100:
+        filename = filename[:100]
+    
+    # Ensure it's not empty
+    if not filename:
+        filename = "Unknown"
+    
+    return filename
 
 
 class FileOrganizer:
@@ -18,27 +376,69 @@ class FileOrganizer:
     and creating directory structures for media files.
     """
     
-    def __init__(self, destination_root: str, folder_structure: str = "city"):
+    def __init__(self, destination_root: str, folder_structure: str = "city",
+                 strict_compare: bool = False, link_duplicates: bool = False):
         """
         Initialize the file organizer.
         
         Args:
             destination_root: Root directory for organized files
             folder_structure: "state" for Country/State or "city" for Country/State/City
+            strict_compare: Always compare file content when checking for
+                duplicates, even if size and modification time match
+            link_duplicates: When the destination index (see
+                build_destination_index) already holds a file with the same
+                content, hardlink it instead of copying the data again
         """
         self.logger = logging.getLogger(__name__)
         self.destination_root = Path(destination_root)
         self.folder_structure = folder_structure
+        self.strict_compare = strict_compare
+        self.link_duplicates = link_duplicates
         
         # Cache for created directories to avoid repeated mkdir calls
         self._directory_cache = {}
         
-        # Counter for skipped files
+        # Directories known to exist, so ancestors shared between locations
+        # (destination root, country, state) are only created once
+        self._mkdir_seen: set = set()
+        
+        # Guards directory creation when files are organized from several threads
+        self._directory_lock = threading.Lock()
+        
+        # Content digests keyed by (path, size, mtime_ns) so a file that is
+        # compared repeatedly (e.g. an existing destination) is read only once
+        self._hash_cache: Dict[Tuple[str, int, int], bytes] = {}
+        
+        # Cleared once the destination filesystem rejects reflink copies
+        self._reflink_supported = True
+        
+        # Names present in each destination directory, listed on first use
+        self._dir_contents: Dict[Path, set] = {}
+        
+        # Read buffers for byte comparisons, allocated once per thread
+        self._compare_buffers = threading.local()
+        
+        # Files already in the destination, keyed by size; built on demand
+        # by build_destination_index
+        self._content_index: Optional[Dict[int, List[FileRecord]]] = None
+        
+        # Counter for skipped files, updated from worker threads
         self.skipped_files_count = 0
+        self._skipped_lock = threading.Lock()
         
         # Ensure destination root exists
         self.destination_root.mkdir(parents=True, exist_ok=True)
-        self.logger.info(f"Destination root: {self.destination_root}")
+        self._mkdir_seen.add(self.destination_root)
+        
+        # Device of the destination, used to skip rename attempts that would
+        # fail with EXDEV for sources on another filesystem
+        self._destination_dev = self.destination_root.stat().st_dev
+        
+        # Folder for files without a known location, the largest single bucket
+        self._unknown_dir = self.destination_root / "Unknown"
+        
+        self.logger.info("Destination root: %s", self.destination_root)
     
     def create_location_directory(self, country: str, state: str, city: str) -> Path:
         """
@@ -52,24 +452,32 @@ class FileOrganizer:
         Returns:
             Path to the created directory
         """
-        # Clean directory names for filesystem compatibility
-        safe_country = self._sanitize_filename(country)
-        safe_state = self._sanitize_filename(state)
-        safe_city = self._sanitize_filename(city)
+        # Fast path for files without location once the Unknown folder exists
+        if (country == "Unknown" and state == "Unknown" and city == "Unknown"
+                and self._unknown_dir in self._mkdir_seen):
+            return self._unknown_dir
         
-        # Create cache key based on folder structure
+        # Cache key based on folder structure; the raw names are used so a
+        # cache hit needs neither sanitizing nor building a key string
         if self.folder_structure == "state":
-            cache_key = f"{safe_country}:{safe_state}"
+            cache_key = (country, state)
         else:
-            cache_key = f"{safe_country}:{safe_state}:{safe_city}"
+            cache_key = (country, state, city)
         
         # Check cache first
-        if cache_key in self._directory_cache:
-            return self._directory_cache[cache_key]
+        location_path = self._directory_cache.get(cache_key)
+        if location_path is not None:
+            return location_path
+        
+        # Clean directory names for filesystem compatibility (calling the
+        # memoized function directly skips the method wrapper's frame)
+        safe_country = _sanitize_filename_cached(_COUNTRY_MAPPINGS.get(country.strip(), country))
+        safe_state = _sanitize_filename_cached(state)
+        safe_city = _sanitize_filename_cached(city)
         
         # Special handling for Unknown location - create single Unknown folder
         if safe_country == "Unknown" and safe_state == "Unknown" and safe_city == "Unknown":
-            location_path = self.destination_root / "Unknown"
+            location_path = self._unknown_dir
         else:
             # Create directory structure based on user preference
             if self.folder_structure == "state":
@@ -80,16 +488,45 @@ class FileOrganizer:
                 location_path = self.destination_root / safe_country / safe_state / safe_city
         
         try:
-            location_path.mkdir(parents=True, exist_ok=True)
-            self.logger.debug(f"Created directory: {location_path}")
+            with self._directory_lock:
+                self._ensure_dir(location_path)
+            self.logger.debug("Created directory: %s", location_path)
             # Cache the result
             self._directory_cache[cache_key] = location_path
             return location_path
         except Exception as e:
-            self.logger.error(f"Failed to create directory {location_path}: {e}")
+            self.logger.error("Failed to create directory %s: %s", location_path, e)
             # Fallback to Unknown directory
             return self.create_location_directory("Unknown", "Unknown", "Unknown")
     
+    def _ensure_dir(self, path: Path) -> None:
+        """
+        Create a directory and any missing ancestors, skipping known ones.
+        
+        Walks up from the path until it reaches a directory already known
+        to exist, then creates only the missing levels top-down with one
+        mkdir call each.
+        
+        Args:
+            path: Directory to create
+        """
+        missing = []
+        current = path
+        while current not in self._mkdir_seen:
+            missing.append(current)
+            parent = current.parent
+            if parent == current:
+                break
+            current = parent
+        
+        for directory in reversed(missing):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                if not os.path.isdir(directory):
+                    raise
+            self._mkdir_seen.add(directory)
+    
     def get_directory_cache_stats(self) -> Dict[str, int]:
         """
         Get directory cache statistics.
@@ -97,11 +534,19 @@ class FileOrganizer:
         Returns:
             Dictionary with cache statistics
         """
+        sanitize_info = _sanitize_filename_cached.cache_info()
         return {
-            'cached_directories': len(self._directory_cache),
-            'cache_keys': list(self._directory_cache.keys())
+            'cached_directories': len(set(self._directory_cache.values())),
+            'cache_keys': [':'.join(key) for key in self._directory_cache],
+            'sanitize_cache_hits': sanitize_info.hits,
+            'sanitize_cache_misses': sanitize_info.misses
         }
     
+    def _count_skipped(self):
+        """Increment the skipped files counter."""
+        with self._skipped_lock:
+            self.skipped_files_count += 1
+    
     def get_skipped_files_count(self) -> int:
         """
         Get the total number of files that were skipped during operations.
@@ -116,7 +561,7 @@ class FileOrganizer:
         Log a summary of skipped files.
         """
         if self.skipped_files_count > 0:
-            self.logger.info(f"Total files skipped during copy/move operations: {self.skipped_files_count}")
+            self.logger.info("Total files skipped during copy/move operations: %s", self.skipped_files_count)
         else:
             self.logger.info("No files were skipped during copy/move operations")
     
@@ -132,32 +577,34 @@ class FileOrganizer:
             True if successful, False otherwise
         """
         try:
-            source_file = Path(source_path)
-            if not source_file.exists():
-                self.logger.error(f"Source file does not exist: {source_path}")
+            # Files coming from scan_directory are known to exist already
+            if not isinstance(source_path, FileRecord) and not os.path.exists(source_path):
+                self.logger.error("Source file does not exist: %s", source_path)
                 return False
             
             # Create destination filename
-            dest_file = destination_path / source_file.name
+            name = os.path.basename(source_path)
+            dest_file = os.path.join(destination_path, name)
+            dest_names = self._destination_names(destination_path)
             
             # Check if file already exists in destination
-            if dest_file.exists():
-                # Check if files are identical
-                if self._files_are_identical(source_file, dest_file):
-                    self.logger.info(f"Skipped (identical file): {source_path} -> {dest_file}")
-                    self.skipped_files_count += 1
-                else:
-                    self.logger.info(f"Skipped (file exists with different content): {source_path} -> {dest_file}")
-                    self.skipped_files_count += 1
-                return True  # Return True since we're skipping intentionally
+            if _name_key(name) in dest_names:
+                return self._skip_existing(source_path, dest_file)
             
-            # Copy the file
-            shutil.copy2(source_file, dest_file)
-            self.logger.info(f"Copied: {source_path} -> {dest_file}")
+            # Copy the file; the exclusive create also catches destination
+            # files that appeared since the directory was listed
+            try:
+                self._copy_with_metadata(source_path, dest_file)
+            except FileExistsError:
+                dest_names.add(_name_key(name))
+                return self._skip_existing(source_path, dest_file)
+            dest_names.add(_name_key(name))
+            self.logger.info("Copied: %s -> %s", source_path, dest_file)
+            self._add_to_index(dest_file)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to copy {source_path}: {e}")
+            self.logger.error("Failed to copy %s: %s", source_path, e)
             return False
     
     def move_file(self, source_path: str, destination_path: Path) -> bool:
@@ -172,34 +619,241 @@ class FileOrganizer:
             True if successful, False otherwise
         """
         try:
-            source_file = Path(source_path)
-            if not source_file.exists():
-                self.logger.error(f"Source file does not exist: {source_path}")
+            # Files coming from scan_directory are known to exist already
+            if not isinstance(source_path, FileRecord) and not os.path.exists(source_path):
+                self.logger.error("Source file does not exist: %s", source_path)
                 return False
             
             # Create destination filename
-            dest_file = destination_path / source_file.name
+            name = os.path.basename(source_path)
+            dest_file = os.path.join(destination_path, name)
+            dest_names = self._destination_names(destination_path)
             
             # Check if file already exists in destination
-            if dest_file.exists():
-                # Check if files are identical
-                if self._files_are_identical(source_file, dest_file):
-                    self.logger.info(f"Skipped (identical file): {source_path} -> {dest_file}")
-                    self.skipped_files_count += 1
+            if _name_key(name) in dest_names:
+                return self._skip_existing(source_path, dest_file)
+            
+            # Move the file: link and unlink on the same filesystem,
+            # otherwise copy and remove the source. Unlike os.rename, which
+            # replaces an existing file, os.link fails if another worker has
+            # just taken the name, so concurrent moves never clobber
+            moved = False
+            source_dev = source_path.dev if isinstance(source_path, FileRecord) else 0
+            if not source_dev:
+                source_dev = os.stat(source_path).st_dev
+            if source_dev == self._destination_dev:
+                try:
+                    os.link(source_path, dest_file)
+                except FileExistsError:
+                    dest_names.add(_name_key(name))
+                    return self._skip_existing(source_path, dest_file)
+                except OSError as e:
+                    # No hard links on this filesystem (FAT, some network shares)
+                    if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+                        raise
                 else:
-                    self.logger.info(f"Skipped (file exists with different content): {source_path} -> {dest_file}")
-                    self.skipped_files_count += 1
-                return True  # Return True since we're skipping intentionally
+                    os.unlink(source_path)
+                    moved = True
             
-            # Move the file
-            shutil.move(str(source_file), str(dest_file))
-            self.logger.info(f"Moved: {source_path} -> {dest_file}")
+            if not moved:
+                try:
+                    self._copy_with_metadata(source_path, dest_file)
+                except FileExistsError:
+                    dest_names.add(_name_key(name))
+                    return self._skip_existing(source_path, dest_file)
+                os.unlink(source_path)
+            dest_names.add(_name_key(name))
+            self.logger.info("Moved: %s -> %s", source_path, dest_file)
+            self._add_to_index(dest_file)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to move {source_path}: {e}")
+            self.logger.error("Failed to move %s: %s", source_path, e)
             return False
     
+    def _skip_existing(self, source_path: str, dest_file: str) -> bool:
+        """
+        Skip a file whose destination name is already taken.
+        
+        Args:
+            source_path: Source file path
+            dest_file: Existing destination file path
+            
+        Returns:
+            True, since skipping is intentional
+        """
+        # Check if files are identical
+        if self._files_are_identical(source_path, dest_file, strict=self.strict_compare):
+            self.logger.info("Skipped (identical file): %s -> %s", source_path, dest_file)
+        else:
+            self.logger.info("Skipped (file exists with different content): %s -> %s", source_path, dest_file)
+        self._count_skipped()
+        return True
+    
+    def _destination_names(self, directory: Path) -> set:
+        """
+        Get the names of the files in a destination directory.
+        
+        The directory is listed once with os.scandir and the set is kept up
+        to date as files are added, so existence checks for later files cost
+        a set lookup instead of a stat call.
+        
+        Args:
+            directory: Destination directory path
+            
+        Returns:
+            Set of name keys (see _name_key) present in the directory
+        """
+        names = self._dir_contents.get(directory)
+        if names is None:
+            with os.scandir(directory) as it:
+                names = {_name_key(entry.name) for entry in it}
+            names = self._dir_contents.setdefault(directory, names)
+        return names
+    
+    def _copy_with_metadata(self, source_file: str, dest_file: str) -> None:
+        """
+        Copy file data and metadata, like shutil.copy2 but using kernel-side copies.
+        
+        The destination is created exclusively; a partially written
+        destination is removed if the copy fails.
+        
+        Args:
+            source_file: Source file path
+            dest_file: Destination file path (must not exist)
+        """
+        binary_flag = getattr(os, 'O_BINARY', 0)
+        src_fd = os.open(source_file, os.O_RDONLY | binary_flag)
+        metadata_copied = False
+        try:
+            src_stat = os.fstat(src_fd)
+            size = src_stat.st_size
+            dst_fd = os.open(dest_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | binary_flag, 0o644)
+            try:
+                # Page cache hints only pay for their syscalls on larger files
+                hint = size >= FADVISE_MIN_SIZE
+                if hint:
+                    _fadvise(src_fd, size, 'POSIX_FADV_SEQUENTIAL')
+                self._fast_copy(src_fd, dst_fd, size)
+                if hint:
+                    # Copied media is not read again; release its page cache
+                    _fadvise(src_fd, size, 'POSIX_FADV_DONTNEED')
+                    _fadvise(dst_fd, size, 'POSIX_FADV_DONTNEED')
+                metadata_copied = self._copy_metadata_fd(src_fd, dst_fd, src_stat)
+            except BaseException:
+                os.close(dst_fd)
+                dst_fd = None
+                try:
+                    os.unlink(dest_file)
+                except OSError:
+                    pass
+                raise
+            finally:
+                if dst_fd is not None:
+                    os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        
+        if not metadata_copied:
+            shutil.copystat(source_file, dest_file)
+    
+    def _copy_metadata_fd(self, src_fd: int, dst_fd: int, src_stat: os.stat_result) -> bool:
+        """
+        Copy timestamps, permission bits and extended attributes between descriptors.
+        
+        Equivalent to shutil.copystat, but works on the already open files,
+        reusing the source stat instead of resolving both paths again.
+        
+        Args:
+            src_fd: Source file descriptor
+            dst_fd: Destination file descriptor
+            src_stat: Result of os.fstat on the source
+            
+        Returns:
+            True if the metadata was copied, False if descriptor-based calls
+            are not supported here and shutil.copystat should be used
+        """
+        if not FD_METADATA_AVAILABLE:
+            return False
+        
+        os.utime(dst_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        try:
+            for name in os.listxattr(src_fd):
+                try:
+                    os.setxattr(dst_fd, name, os.getxattr(src_fd, name))
+                except OSError as e:
+                    # Same attributes shutil.copystat tolerates failing on
+                    if e.errno not in (errno.EPERM, errno.ENOTSUP, errno.ENODATA, errno.EINVAL):
+                        raise
+        except OSError as e:
+            if e.errno not in (errno.ENOTSUP, errno.ENODATA, errno.EINVAL):
+                raise
+        os.chmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+        return True
+    
+    def _fast_copy(self, src_fd: int, dst_fd: int, size: int) -> None:
+        """
+        Copy file data between descriptors with the fastest available method.
+        
+        Tries a FICLONE reflink (Linux, same copy-on-write filesystem), then
+        os.copy_file_range (in-kernel copy), then os.sendfile (Linux), then a
+        userspace shutil.copyfileobj loop. Each copy step continues from the
+        current file offsets, so a partial copy is resumed by the next method.
+        
+        Args:
+            src_fd: Source file descriptor opened for reading
+            dst_fd: Destination file descriptor opened for writing
+            size: Size of the source file in bytes
+        """
+        # Errors meaning "this method is not supported here", not real I/O errors
+        unsupported = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EPERM,
+                       errno.ENOTSUP, getattr(errno, 'EOPNOTSUPP', errno.ENOTSUP)}
+        copied = 0
+        
+        if FICLONE_AVAILABLE and self._reflink_supported and size > 0:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                return
+            except OSError as e:
+                if e.errno not in unsupported and e.errno != errno.ENOTTY:
+                    raise
+                # Only a different filesystem is worth retrying for later files
+                if e.errno != errno.EXDEV:
+                    self._reflink_supported = False
+        
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(src_fd, dst_fd, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+                if copied >= size:
+                    return
+            except OSError as e:
+                if e.errno not in unsupported:
+                    raise
+        
+        if SENDFILE_AVAILABLE:
+            try:
+                while copied < size:
+                    sent = os.sendfile(dst_fd, src_fd, None, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+                if copied >= size:
+                    return
+            except TypeError:
+                # Platform sendfile without offset=None support
+                pass
+            except OSError as e:
+                if e.errno not in unsupported and e.errno != errno.ENOTSOCK:
+                    raise
+        
+        # Last resort: userspace copy of whatever remains
+        with open(src_fd, 'rb', closefd=False) as fsrc, open(dst_fd, 'wb', closefd=False) as fdst:
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    
     def organize_file(self, source_path: str, country: str, state: str, city: str,
                      operation: str = "copy") -> bool:
         """
@@ -219,6 +873,11 @@ class FileOrganizer:
             # Create the location directory
             location_dir = self.create_location_directory(country, state, city)
             
+            # Reuse content already present elsewhere in the destination
+            if self.link_duplicates and self._content_index is not None:
+                if self._link_indexed_duplicate(source_path, location_dir, operation):
+                    return True
+            
             # Perform the file operation
             if operation.lower() == "move":
                 return self.move_file(source_path, location_dir)
@@ -226,15 +885,210 @@ class FileOrganizer:
                 return self.copy_file(source_path, location_dir)
                 
         except Exception as e:
-            self.logger.error(f"Failed to organize file {source_path}: {e}")
+            self.logger.error("Failed to organize file %s: %s", source_path, e)
             return False
     
-    def scan_directory(self, source_dir: str) -> List[str]:
+    def build_destination_index(self) -> int:
+        """
+        Index the media files already present under the destination root.
+        
+        Files are grouped by size; content digests are only computed when a
+        source file has the same size as an indexed one. Digests saved by
+        save_destination_index on a previous run are reused for files whose
+        size and mtime have not changed.
+        
+        Returns:
+            Number of files indexed
+        """
+        persisted = {}
+        index_path = self.destination_root / INDEX_FILENAME
+        if index_path.exists():
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    saved_index = json.load(f)
+                # Digests made with another hash function cannot be compared
+                if saved_index.get('algorithm') == DIGEST_ALGORITHM:
+                    for rel_path, size, mtime_ns, digest in saved_index.get('files', []):
+                        persisted[rel_path] = (size, mtime_ns, digest)
+            except (OSError, ValueError, TypeError) as e:
+                self.logger.warning("Ignoring unreadable destination index %s: %s", index_path, e)
+        
+        content_index: Dict[int, List[FileRecord]] = {}
+        count = 0
+        for entry in self._scandir_recursive(str(self.destination_root)):
+            name = entry.name
+            dot = name.rfind('.')
+            if dot <= 0 or name[dot + 1:].lower() not in _MEDIA_EXTS:
+                continue
+            record = self._make_record(entry)
+            if record is None:
+                continue
+            content_index.setdefault(record.size, []).append(record)
+            count += 1
+            
+            saved = persisted.get(os.path.relpath(record, self.destination_root))
+            if saved and saved[0] == record.size and saved[1] == record.mtime_ns and saved[2]:
+                self._hash_cache[(record.path, record.size, record.mtime_ns)] = bytes.fromhex(saved[2])
+        
+        self._content_index = content_index
+        self.logger.info("Indexed %s files in %s", count, self.destination_root)
+        return count
+    
+    def save_destination_index(self) -> bool:
+        """
+        Persist the destination index and known digests next to the organized files.
+        
+        Returns:
+            True if the index was written, False otherwise
+        """
+        if self._content_index is None:
+            return False
+        
+        files = []
+        for records in self._content_index.values():
+            for record in records:
+                digest = self._hash_cache.get((record.path, record.size, record.mtime_ns))
+                files.append([
+                    os.path.relpath(record, self.destination_root),
+                    record.size,
+                    record.mtime_ns,
+                    digest.hex() if digest else None,
+                ])
+        
+        index_path = self.destination_root / INDEX_FILENAME
+        try:
+            with open(index_path, 'w', encoding='utf-8') as f:
+                json.dump({'algorithm': DIGEST_ALGORITHM, 'files': files}, f)
+            return True
+        except OSError as e:
+            self.logger.error("Failed to save destination index %s: %s", index_path, e)
+            return False
+    
+    def _add_to_index(self, file_path: str) -> None:
+        """
+        Add a newly organized file to the destination index, if one is built.
+        
+        Args:
+            file_path: Path of the file in the destination
+        """
+        if self._content_index is None:
+            return
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return
+        record = FileRecord(str(file_path), file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_dev)
+        self._content_index.setdefault(record.size, []).append(record)
+    
+    def _link_indexed_duplicate(self, source_path: str, destination_path: Path, operation: str) -> bool:
+        """
+        Hardlink an indexed destination file with the same content as the source.
+        
+        Args:
+            source_path: Source file path
+            destination_path: Destination directory path
+            operation: "copy" or "move" (a move also removes the source)
+            
+        Returns:
+            True if the file was linked, False if the regular copy/move path
+            should be used instead
+        """
+        name = os.path.basename(source_path)
+        dest_file = os.path.join(destination_path, name)
+        dest_names = self._destination_names(destination_path)
+        if _name_key(name) in dest_names:
+            return False
+        
+        try:
+            size, mtime_ns = self._size_and_mtime(source_path)
+            candidates = self._content_index.get(size)
+            if not candidates:
+                return False
+            
+            source_digest = self._digest(source_path, size, mtime_ns)
+            for candidate in list(candidates):
+                if self._digest(candidate, candidate.size, candidate.mtime_ns) != source_digest:
+                    continue
+                os.link(candidate, dest_file)
+                dest_names.add(_name_key(name))
+                if operation.lower() == "move":
+                    os.unlink(source_path)
+                self.logger.info("Linked (duplicate of %s): %s -> %s", candidate, source_path, dest_file)
+                # The link shares the candidate's inode, so its digest is known
+                self._hash_cache[(dest_file, candidate.size, candidate.mtime_ns)] = source_digest
+                self._add_to_index(dest_file)
+                return True
+        except OSError as e:
+            self.logger.debug("Could not link duplicate for %s: %s", source_path, e)
+        
+        return False
+    
+    def organize_batch(self, items: List[Tuple[str, str, str, str]], operation: str = "copy",
+                       workers: Optional[int] = None) -> Iterator[Tuple[Tuple[str, str, str, str], bool, Optional[Exception]]]:
+        """
+        Organize many files concurrently using a thread pool.
+        
+        All distinct location directories are created serially before the
+        file operations are dispatched, so workers only copy/move files.
+        
+        Args:
+            items: List of (source_path, country, state, city) tuples
+            operation: "copy" or "move"
+            workers: Number of worker threads (default: min(32, 4 x CPU count))
+            
+        Yields:
+            Tuples of (item, success, exception) as operations complete
+        """
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+        
+        self.plan_and_prepare(items)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_item = {
+                executor.submit(self.organize_file, *item, operation): item
+                for item in items
+            }
+            for future in as_completed(future_to_item):
+                item = future_to_item[future]
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    self.logger.error("Failed to organize file %s: %s", item[0], e)
+                    yield item, False, e
+    
+    def plan_and_prepare(self, items: List[Tuple[str, str, str, str]]) -> int:
+        """
+        Create all location directories needed by a set of items up front.
+        
+        Each distinct location is sanitized and created once, and its
+        directory listing is loaded, so the file operations that follow
+        only do cache lookups.
+        
+        Args:
+            items: List of (source_path, country, state, city) tuples
+            
+        Returns:
+            Number of distinct location directories prepared
+        """
+        directories = set()
+        for location in {(country, state, city) for _, country, state, city in items}:
+            directories.add(self.create_location_directory(*location))
+        for directory in directories:
+            try:
+                self._destination_names(directory)
+            except OSError as e:
+                self.logger.debug("Could not list %s: %s", directory, e)
+        return len(directories)
+    
+    def scan_directory(self, source_dir: str, workers: int = 1) -> List[str]:
         """
         Recursively scan a directory for media files.
         
         Args:
             source_dir: Source directory to scan
+            workers: Number of threads used to walk directories; values
+                greater than 1 use scan_directory_parallel
             
         Returns:
             List of media file paths found
@@ -243,249 +1097,193 @@ class FileOrganizer:
         source_path = Path(source_dir)
         
         if not source_path.exists():
-            self.logger.error(f"Source directory does not exist: {source_dir}")
+            self.logger.error("Source directory does not exist: %s", source_dir)
             return media_files
         
+        if workers > 1:
+            return self.scan_directory_parallel(source_dir, workers)
+        
         try:
-            # Supported media extensions
-            media_extensions = {
-                '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp',
-                '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp'
-            }
-            
-            for file_path in source_path.rglob('*'):
-                if file_path.is_file() and file_path.suffix.lower() in media_extensions:
-                    media_files.append(str(file_path))
+            if FWALK_AVAILABLE:
+                media_files.extend(self._fwalk_records(source_dir))
+            else:
+                for entry in self._scandir_recursive(source_dir):
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot + 1:].lower() in _MEDIA_EXTS:
+                        record = self._make_record(entry)
+                        if record is not None:
+                            media_files.append(record)
             
-            self.logger.info(f"Found {len(media_files)} media files in {source_dir}")
+            self.logger.info("Found %s media files in %s", len(media_files), source_dir)
             return media_files
             
         except Exception as e:
-            self.logger.error(f"Error scanning directory {source_dir}: {e}")
+            self.logger.error("Error scanning directory %s: %s", source_dir, e)
             return media_files
     
-    def _sanitize_filename(self, filename: str) -> str:
+    def scan_directory_parallel(self, source_dir: str, workers: int = 8) -> List[str]:
         """
-        Sanitize a filename for filesystem compatibility.
+        Scan a directory for media files using a pool of directory workers.
+        
+        Each directory is a separate task on a LIFO queue (depth-first order),
+        so directory reads overlap on high-latency filesystems such as NFS/SMB.
         
         Args:
-            filename: Original filename
+            source_dir: Source directory to scan
+            workers: Number of worker threads
             
         Returns:
-            Sanitized filename
+            List of media file paths found
         """
-        # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # For common Hindi names, provide English equivalents
-        hindi_mappings = {
-            'नई दिल्ली': 'New Delhi',
-            'मुंबई': 'Mumbai',
-            'कोलकाता': 'Kolkata',
-            'चेन्नई': 'Chennai',
-            'बैंगलोर': 'Bangalore',
-            'हैदराबाद': 'Hyderabad',
-            'अहमदाबाद': 'Ahmedabad',
-            'पुणे': 'Pune',
-            'जयपुर': 'Jaipur',
-            'लखनऊ': 'Lucknow',
-            'कानपुर': 'Kanpur',
-            'नागपुर': 'Nagpur',
-            'इंदौर': 'Indore',
-            'थाणे': 'Thane',
-            'भोपाल': 'Bhopal',
-            'विशाखापत्तनम': 'Visakhapatnam',
-            'पटना': 'Patna',
-            'वडोदरा': 'Vadodara',
-            'घाटकोपर': 'Ghatkopar',
-            'लुधियाना': 'Ludhiana',
-            'आगरा': 'Agra',
-            'नाशिक': 'Nashik',
-            'फरीदाबाद': 'Faridabad',
-            'मेरठ': 'Meerut',
-            'राजकोट': 'Rajkot',
-            'कलकत्ता': 'Kolkata',
-            'मद्रास': 'Chennai',
-            'बॉम्बे': 'Mumbai',
-            'दिल्ली': 'Delhi',
-            'महाराष्ट्र': 'Maharashtra',
-            'पश्चिम बंगाल': 'West Bengal',
-            'तमिलनाडु': 'Tamil Nadu',
-            'कर्नाटक': 'Karnataka',
-            'उत्तर प्रदेश': 'Uttar Pradesh',
-            'मध्य प्रदेश': 'Madhya Pradesh',
-            'गुजरात': 'Gujarat',
-            'राजस्थान': 'Rajasthan',
-            'पंजाब': 'Punjab',
-            'हरियाणा': 'Haryana',
-            'बिहार': 'Bihar',
-            'झारखंड': 'Jharkhand',
-            'ओडिशा': 'Odisha',
-            'छत्तीसगढ़': 'Chhattisgarh',
-            'तेलंगाना': 'Telangana',
-            'आंध्र प्रदेश': 'Andhra Pradesh',
-            'केरल': 'Kerala',
-            'गोवा': 'Goa',
-        }
+        pending_dirs = queue.LifoQueue()
+        pending_dirs.put(source_dir)
         
-        # For common Arabic names, provide English equivalents
-        arabic_mappings = {
-            # Qatar cities and country
-            'الدوحة': 'Doha',
-            'الوكرة': 'Al Wakrah',
-            'الخور': 'Al Khor',
-            'الريان': 'Al Rayyan',
-            'أم صلال': 'Umm Salal',
-            'الظعاين': 'Al Daayen',
-            'الشحانية': 'Al Shamal',
-            'قطر': 'Qatar',
-            # UAE cities and country
-            'دبي': 'Dubai',
-            'أبو ظبي': 'Abu Dhabi',
-            'الشارقة': 'Sharjah',
-            'العين': 'Al Ain',
-            'أم القيوين': 'Umm Al Quwain',
-            'رأس الخيمة': 'Ras Al Khaimah',
-            'الفجيرة': 'Fujairah',
-            'عجمان': 'Ajman',
-            'الإمارات': 'United Arab Emirates',
-            # Kuwait cities and country
-            'الكويت': 'Kuwait City',
-            'حولي': 'Hawally',
-            'الجهراء': 'Al Jahra',
-            'مبارك الكبير': 'Mubarak Al Kabeer',
-            'الأحمدي': 'Al Ahmadi',
-            'الفروانية': 'Al Farwaniyah',
-            # Bahrain cities and country
-            'المنامة': 'Manama',
-            'المحرق': 'Muharraq',
-            'الرفاع': 'Riffa',
-            'مدينة عيسى': 'Isa Town',
-            'مدينة حمد': 'Hamad Town',
-            'الدراز': 'Dar Kulaib',
-            'البحرين': 'Bahrain',
-            # Oman cities and country
-            'مسقط': 'Muscat',
-            'صلالة': 'Salalah',
-            'صحار': 'Sohar',
-            'نزوى': 'Nizwa',
-            'البريمي': 'Al Buraimi',
-            'صور': 'Sur',
-            'عمان': 'Oman',
-            # Jordan cities and country
-            'عمان': 'Amman',
-            'إربد': 'Irbid',
-            'الزرقاء': 'Zarqa',
-            'العقبة': 'Aqaba',
-            'السلط': 'Salt',
-            'الكرك': 'Karak',
-            'الأردن': 'Jordan',
-            # Lebanon cities and country
-            'بيروت': 'Beirut',
-            'طرابلس': 'Tripoli',
-            'صيدا': 'Sidon',
-            'بعلبك': 'Baalbek',
-            'جبيل': 'Byblos',
-            'زحلة': 'Zahle',
-            'لبنان': 'Lebanon',
-            # Syria cities and country
-            'دمشق': 'Damascus',
-            'حلب': 'Aleppo',
-            'حمص': 'Homs',
-            'حماة': 'Hama',
-            'اللاذقية': 'Latakia',
-            'دير الزور': 'Deir ez-Zor',
-            'سوريا': 'Syria',
-            # Iraq cities and country
-            'بغداد': 'Baghdad',
-            'البصرة': 'Basra',
-            'الموصل': 'Mosul',
-            'أربيل': 'Erbil',
-            'السليمانية': 'Sulaymaniyah',
-            'النجف': 'Najaf',
-            'العراق': 'Iraq',
-            # Yemen cities and country
-            'صنعاء': 'Sanaa',
-            'عدن': 'Aden',
-            'تعز': 'Taiz',
-            'الحديدة': 'Al Hudaydah',
-            'إب': 'Ibb',
-            'ذمار': 'Dhamar',
-            'اليمن': 'Yemen',
-            # Saudi cities and country
-            'الرياض': 'Riyadh',
-            'جدة': 'Jeddah',
-            'مكة': 'Makkah',
-            'المدينة': 'Madinah',
-            'الدمام': 'Dammam',
-            'الخبر': 'Khobar',
-            'الظهران': 'Dhahran',
-            'تبوك': 'Tabuk',
-            'حائل': 'Hail',
-            'بريدة': 'Buraidah',
-            'الطائف': 'Taif',
-            'أبها': 'Abha',
-            'جازان': 'Jazan',
-            'نجران': 'Najran',
-            'الجوف': 'Jouf',
-            'السعودية': 'Saudi Arabia',
-            # Egypt
-            'مصر': 'Egypt',
-            'القاهرة': 'Cairo',
-            'الإسكندرية': 'Alexandria',
-            'الأقصر': 'Luxor',
-            'أسوان': 'Aswan',
-            'شرم الشيخ': 'Sharm El Sheikh',
-        }
+        # Number of directories queued or being scanned; the walk is
+        # finished when it drops to zero
+        outstanding = [1]
+        lock = threading.Lock()
+        finished = threading.Event()
         
-        # First, try to find a mapping for the original name (trim whitespace first)
-        trimmed_filename = filename.strip()
-        if trimmed_filename in hindi_mappings:
-            filename = hindi_mappings[trimmed_filename]
-        elif trimmed_filename in arabic_mappings:
-            filename = arabic_mappings[trimmed_filename]
-        else:
-            # Handle non-ASCII characters by transliterating to ASCII
-            original_filename = filename  # Keep original for fallback
-            try:
-                import unicodedata
-                # Normalize unicode characters and try to convert to ASCII
-                filename = unicodedata.normalize('NFKD', filename)
-                # Try to encode as ASCII, replace non-ASCII with closest ASCII equivalent
-                filename = filename.encode('ascii', 'ignore').decode('ascii')
-            except ImportError:
-                # If unicodedata is not available, just remove non-ASCII characters
-                filename = ''.join(char for char in filename if ord(char) < 128)
-            
-            # If the result is empty after ASCII conversion, try to preserve the original meaning
-            if not filename.strip():
-                # Try to find a mapping for the original name (trim whitespace first)
-                trimmed_original = original_filename.strip()
-                if trimmed_original in hindi_mappings:
-                    filename = hindi_mappings[trimmed_original]
-                elif trimmed_original in arabic_mappings:
-                    filename = arabic_mappings[trimmed_original]
-                else:
-                    filename = "Location"
+        def worker() -> List[str]:
+            found = []
+            while not finished.is_set():
+                try:
+                    path = pending_dirs.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                
+                try:
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            if entry.is_symlink():
+                                continue
+                            if entry.is_file(follow_symlinks=False):
+                                name = entry.name
+                                dot = name.rfind('.')
+                                if dot > 0 and name[dot + 1:].lower() in _MEDIA_EXTS:
+                                    record = self._make_record(entry)
+                                    if record is not None:
+                                        found.append(record)
+                            elif entry.is_dir(follow_symlinks=False):
+                                with lock:
+                                    outstanding[0] += 1
+                                pending_dirs.put(entry.path)
+                except (PermissionError, OSError) as e:
+                    self.logger.warning("Skipping unreadable directory %s: %s", path, e)
+                finally:
+                    with lock:
+                        outstanding[0] -= 1
+                        if outstanding[0] == 0:
+                            finished.set()
+            return found
         
-        # Remove leading/trailing spaces and dots
-        filename = filename.strip('. ')
+        media_files = []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(worker) for _ in range(workers)]
+                for future in futures:
+                    media_files.extend(future.result())
+        except Exception as e:
+            finished.set()
+            self.logger.error("Error scanning directory %s: %s", source_dir, e)
+            return media_files
         
-        # Replace multiple spaces with single space
-        import re
-        filename = re.sub(r'\s+', ' ', filename)
+        self.logger.info("Found %s media files in %s", len(media_files), source_dir)
+        return media_files
+    
+    def _make_record(self, entry: os.DirEntry) -> Optional[FileRecord]:
+        """
+        Build a FileRecord from a directory entry.
         
-        # Limit length
-        if len(filename) > 100:
-            filename = filename[:100]
+        Args:
+            entry: Directory entry of a regular file
+            
+        Returns:
+            FileRecord with the entry's path, size and mtime, or None if the
+            file could not be stat'ed
+        """
+        try:
+            entry_stat = entry.stat(follow_symlinks=False)
+        except OSError as e:
+            self.logger.warning("Skipping unreadable file %s: %s", entry.path, e)
+            return None
+        return FileRecord(entry.path, entry_stat.st_size, entry_stat.st_mtime_ns, entry_stat.st_dev)
+    
+    def _fwalk_records(self, path: str) -> Iterator[FileRecord]:
+        """
+        Recursively yield FileRecords of media files using os.fwalk.
         
-        # Ensure it's not empty
-        if not filename:
-            filename = "Unknown"
+        Media files are stat'ed relative to their open directory descriptor,
+        avoiding a full path lookup for every file in deep trees. Symlinks
+        are not followed and unreadable directories are logged and ignored.
         
-        return filename
+        Args:
+            path: Directory to walk
+            
+        Yields:
+            FileRecords of regular media files found under the directory
+        """
+        def on_error(e: OSError):
+            self.logger.warning("Skipping unreadable directory %s: %s", e.filename, e)
+        
+        for dirpath, _dirnames, filenames, dirfd in os.fwalk(path, onerror=on_error):
+            for name in filenames:
+                dot = name.rfind('.')
+                if dot <= 0 or name[dot + 1:].lower() not in _MEDIA_EXTS:
+                    continue
+                try:
+                    file_stat = os.stat(name, dir_fd=dirfd, follow_symlinks=False)
+                except OSError as e:
+                    self.logger.warning("Skipping unreadable file %s: %s", os.path.join(dirpath, name), e)
+                    continue
+                # fwalk lists symlinks and special files alongside regular files
+                if stat.S_ISREG(file_stat.st_mode):
+                    yield FileRecord(os.path.join(dirpath, name), file_stat.st_size, file_stat.st_mtime_ns,
+                                     file_stat.st_dev)
+    
+    def _scandir_recursive(self, path: str) -> Iterator[os.DirEntry]:
+        """
+        Recursively yield directory entries of regular files under a directory.
+        
+        Uses os.scandir so file type checks come from the cached directory
+        entry instead of a separate stat() call per entry. Directories are
+        walked from an explicit stack rather than nested generators, so
+        each entry is yielded directly regardless of tree depth. Symlinks
+        are skipped and unreadable directories are logged and ignored.
+        
+        Args:
+            path: Directory to walk
+            
+        Yields:
+            Directory entries of regular files found under the directory
+        """
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except (PermissionError, OSError) as e:
+                self.logger.warning("Skipping unreadable directory %s: %s", current, e)
+    
+    def _sanitize_filename(self, filename: str) -> str:
+        """
+        Sanitize a filename for filesystem compatibility.
+        
+        Args:
+            filename: Original filename
+            
+        Returns:
+            Sanitized filename
+        """
+        return _sanitize_filename_cached(filename)
     
     def _get_unique_filename(self, file_path: Path) -> Path:
         """
@@ -512,37 +1310,223 @@ class FileOrganizer:
             
             counter += 1
     
-    def _files_are_identical(self, file1: Path, file2: Path) -> bool:
+    def _files_are_identical(self, file1: str, file2: str, strict: bool = False) -> bool:
         """
         Check if two files are identical by comparing their content.
         
+        Files with the same size and modification time are treated as
+        identical without reading them: copies made by this tool preserve
+        mtime, so this makes re-runs over an organized tree nearly free.
+        The tradeoff is that a same-size file whose content was changed
+        while keeping its mtime is not detected; pass strict=True to always
+        compare content.
+        
+        Content is compared byte for byte, which stops at the first
+        difference. When a digest of either file is already cached (e.g. a
+        destination file from a saved index), only the other file is read
+        and hashed.
+        
         Args:
-            file1: First file path
-            file2: Second file path
+            file1: First file path (a FileRecord avoids a stat call)
+            file2: Second file path (a FileRecord avoids a stat call)
+            strict: Compare content even when size and mtime match
             
         Returns:
             True if files are identical, False otherwise
         """
         try:
-            if not file1.exists() or not file2.exists():
-                return False
+            size1, mtime1_ns = self._size_and_mtime(file1)
+            size2, mtime2_ns = self._size_and_mtime(file2)
             
             # Compare file sizes first (fast check)
-            if file1.stat().st_size != file2.stat().st_size:
+            if size1 != size2:
                 return False
             
-            # Compare file content (slower but more accurate)
-            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
+            # Same size and mtime: assume identical unless asked to verify
+            if not strict and mtime1_ns == mtime2_ns:
+                return True
+            
+            # Reuse digests known from the destination index: when one side
+            # is known, hashing the other reads a single file instead of two
+            digest1 = self._hash_cache.get((os.fspath(file1), size1, mtime1_ns))
+            digest2 = self._hash_cache.get((os.fspath(file2), size2, mtime2_ns))
+            if digest1 is not None or digest2 is not None:
+                if digest1 is None:
+                    digest1 = self._digest(file1, size1, mtime1_ns)
+                if digest2 is None:
+                    digest2 = self._digest(file2, size2, mtime2_ns)
+                return digest1 == digest2
+            
+            # Large files usually differ near the start, middle or end, so
+            # sample those regions before reading everything
+            if size1 >= SIGNATURE_MIN_SIZE and self._fast_signature(file1, size1) != self._fast_signature(file2, size2):
+                return False
+            
+            # Otherwise compare the bytes directly, stopping at the first difference
+            return self._compare_content(file1, file2)
+            
+        except Exception as e:
+            self.logger.debug("Error comparing files %s and %s: %s", file1, file2, e)
+            return False
+    
+    def _compare_content(self, file1: str, file2: str) -> bool:
+        """
+        Compare the content of two files byte for byte.
+        
+        Reads both files with unbuffered readinto calls into a pair of
+        per-thread buffers, so no bytes objects are allocated per chunk.
+        Larger files are read with sequential access hints and dropped from
+        the page cache afterwards.
+        
+        Args:
+            file1: First file path
+            file2: Second file path
+            
+        Returns:
+            True if the contents are equal, False otherwise
+        """
+        buffers = getattr(self._compare_buffers, 'pair', None)
+        if buffers is None:
+            buffers = (bytearray(COMPARE_BUFFER_SIZE), bytearray(COMPARE_BUFFER_SIZE))
+            self._compare_buffers.pair = buffers
+        buf1, buf2 = buffers
+        
+        with open(file1, 'rb', buffering=0) as f1, open(file2, 'rb', buffering=0) as f2:
+            fd1, fd2 = f1.fileno(), f2.fileno()
+            size = os.fstat(fd1).st_size
+            hint = size >= FADVISE_MIN_SIZE
+            if hint:
+                _fadvise(fd1, size, 'POSIX_FADV_SEQUENTIAL')
+                _fadvise(fd2, size, 'POSIX_FADV_SEQUENTIAL')
+            try:
                 while True:
-                    chunk1 = f1.read(8192)
-                    chunk2 = f2.read(8192)
-                    if chunk1 != chunk2:
+                    n1 = f1.readinto(buf1)
+                    n2 = f2.readinto(buf2)
+                    if n1 != n2:
                         return False
-                    if not chunk1:  # End of file
-                        break
+                    if n1 == 0:
+                        return True
+                    if n1 == COMPARE_BUFFER_SIZE:
+                        if buf1 != buf2:
+                            return False
+                    elif memoryview(buf1)[:n1] != memoryview(buf2)[:n2]:
+                        return False
+            finally:
+                if hint:
+                    # Compared files are not read again; keep the cache for others
+                    _fadvise(fd1, size, 'POSIX_FADV_DONTNEED')
+                    _fadvise(fd2, size, 'POSIX_FADV_DONTNEED')
+    
+    def _fast_signature(self, file_path: str, size: int) -> bytes:
+        """
+        Compute a cheap fingerprint from the size and three samples of a file.
+        
+        Hashes SIGNATURE_SAMPLE_SIZE bytes from the head, middle and tail of
+        the file, so two large files can be told apart after reading a few
+        MiB of each. Equal signatures do not prove equal content.
+        
+        Args:
+            file_path: Path to the file
+            size: File size in bytes
             
-            return True
+        Returns:
+            Signature bytes
+        """
+        if BLAKE3_AVAILABLE:
+            hasher = blake3.blake3()
+        else:
+            hasher = hashlib.blake2b()
+        hasher.update(size.to_bytes(8, 'little'))
+        with open(file_path, 'rb', buffering=0) as f:
+            for offset in (0, size // 2, size - SIGNATURE_SAMPLE_SIZE):
+                f.seek(offset)
+                hasher.update(f.read(SIGNATURE_SAMPLE_SIZE))
+        return hasher.digest()
+    
+    def _size_and_mtime(self, file_path: str) -> Tuple[int, int]:
+        """
+        Get the size and modification time of a file.
+        
+        Args:
+            file_path: File path; FileRecord values are answered without a stat call
             
-        except Exception as e:
-            self.logger.debug(f"Error comparing files {file1} and {file2}: {e}")
-            return False 
\ No newline at end of file
+        Returns:
+            Tuple of (size, mtime_ns)
+        """
+        if isinstance(file_path, FileRecord):
+            return file_path.size, file_path.mtime_ns
+        file_stat = os.stat(file_path)
+        return file_stat.st_size, file_stat.st_mtime_ns
+    
+    def _digest(self, file_path: str, size: int, mtime_ns: int) -> bytes:
+        """
+        Get the content digest of a file, using the hash cache when possible.
+        
+        Uses BLAKE3 (memory-mapped, multithreaded) when available and falls
+        back to streaming BLAKE2b otherwise.
+        
+        Args:
+            file_path: Path to the file
+            size: File size in bytes
+            mtime_ns: File modification time in nanoseconds
+            
+        Returns:
+            Digest bytes of the file content
+        """
+        cache_key = (os.fspath(file_path), size, mtime_ns)
+        digest = self._hash_cache.get(cache_key)
+        if digest is not None:
+            return digest
+        
+        digest = None
+        if BLAKE3_AVAILABLE:
+            try:
+                hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                hasher.update_mmap(str(file_path))
+                digest = hasher.digest()
+            except (OSError, ValueError, AttributeError) as e:
+                self.logger.debug("BLAKE3 mmap hashing failed for %s: %s", file_path, e)
+        
+        if digest is None:
+            digest = self._blake2b_digest(file_path, size)
+        
+        self._hash_cache[cache_key] = digest
+        return digest
+    
+    def _blake2b_digest(self, file_path: str, size: int) -> bytes:
+        """
+        Compute a BLAKE2b digest of a file.
+        
+        Files above MMAP_MIN_SIZE are memory-mapped and hashed in one call,
+        which avoids allocating a bytes object per chunk; the kernel is
+        advised of the sequential access for readahead. Smaller files, and
+        files that cannot be mapped, are streamed through hashlib.file_digest
+        where available (Python 3.11+), otherwise read in 1 MiB chunks.
+        
+        Args:
+            file_path: Path to the file
+            size: File size in bytes
+            
+        Returns:
+            Digest bytes of the file content
+        """
+        hasher = hashlib.blake2b()
+        with open(file_path, 'rb') as f:
+            if size >= MMAP_MIN_SIZE:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        hasher.update(mapped)
+                    return hasher.digest()
+                except (OSError, ValueError) as e:
+                    self.logger.debug("mmap hashing failed for %s: %s", file_path, e)
+                    hasher = hashlib.blake2b()
+                    f.seek(0)
+            
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: reads into a reusable buffer in C
+                return hashlib.file_digest(f, hashlib.blake2b).digest()
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+        return hasher.digest()
@@ -0,0 +1,667 @@
+"""
+Location name tables used by the geocoder.
+
+Maps native-language country, state and city names returned by geocoding
+services to English, and infers missing states from well-known cities.
+State and city keys must be non-ASCII: the geocoder skips those lookups
+for ASCII names. Also expands the country and state codes of batch
+providers to the names Nominatim returns.
+"""
+
+# State inferred from the city when the geocoder returns no state,
+# keyed by (city, country)
+CITY_TO_STATE = {
+    # India cities
+    ("New Delhi", "India"): "Delhi",
+    ("Mumbai", "India"): "Maharashtra",
+    ("Kolkata", "India"): "West Bengal",
+    ("Chennai", "India"): "Tamil Nadu",
+    ("Bangalore", "India"): "Karnataka",
+    ("Hyderabad", "India"): "Telangana",
+    ("Ahmedabad", "India"): "Gujarat",
+    ("Pune", "India"): "Maharashtra",
+    ("Jaipur", "India"): "Rajasthan",
+    ("Lucknow", "India"): "Uttar Pradesh",
+    ("Kanpur", "India"): "Uttar Pradesh",
+    ("Nagpur", "India"): "Maharashtra",
+    ("Indore", "India"): "Madhya Pradesh",
+    ("Thane", "India"): "Maharashtra",
+    ("Bhopal", "India"): "Madhya Pradesh",
+    ("Visakhapatnam", "India"): "Andhra Pradesh",
+    ("Patna", "India"): "Bihar",
+    ("Vadodara", "India"): "Gujarat",
+    ("Ludhiana", "India"): "Punjab",
+    ("Agra", "India"): "Uttar Pradesh",
+    ("Nashik", "India"): "Maharashtra",
+    ("Faridabad", "India"): "Haryana",
+    ("Meerut", "India"): "Uttar Pradesh",
+    ("Rajkot", "India"): "Gujarat",
+    # Qatar cities
+    ("Doha", "Qatar"): "Doha",
+    ("Al Wakrah", "Qatar"): "Al Wakrah",
+    ("Al Khor", "Qatar"): "Al Khor",
+    ("Al Rayyan", "Qatar"): "Al Rayyan",
+    ("Umm Salal", "Qatar"): "Umm Salal",
+    ("Al Daayen", "Qatar"): "Al Daayen",
+    ("Al Shamal", "Qatar"): "Al Shamal",
+    # UAE cities
+    ("Dubai", "United Arab Emirates"): "Dubai",
+    ("Abu Dhabi", "United Arab Emirates"): "Abu Dhabi",
+    ("Sharjah", "United Arab Emirates"): "Sharjah",
+    ("Al Ain", "United Arab Emirates"): "Al Ain",
+    ("Umm Al Quwain", "United Arab Emirates"): "Umm Al Quwain",
+    ("Ras Al Khaimah", "United Arab Emirates"): "Ras Al Khaimah",
+    ("Fujairah", "United Arab Emirates"): "Fujairah",
+    ("Ajman", "United Arab Emirates"): "Ajman",
+    # Kuwait cities
+    ("Kuwait City", "Kuwait"): "Kuwait",
+    ("Hawally", "Kuwait"): "Hawally",
+    ("Al Jahra", "Kuwait"): "Al Jahra",
+    ("Mubarak Al Kabeer", "Kuwait"): "Mubarak Al Kabeer",
+    ("Al Ahmadi", "Kuwait"): "Al Ahmadi",
+    ("Al Farwaniyah", "Kuwait"): "Al Farwaniyah",
+    # Bahrain cities
+    ("Manama", "Bahrain"): "Manama",
+    ("Muharraq", "Bahrain"): "Muharraq",
+    ("Riffa", "Bahrain"): "Riffa",
+    ("Isa Town", "Bahrain"): "Isa Town",
+    ("Hamad Town", "Bahrain"): "Hamad Town",
+    ("Dar Kulaib", "Bahrain"): "Dar Kulaib",
+    # Oman cities
+    ("Muscat", "Oman"): "Muscat",
+    ("Salalah", "Oman"): "Salalah",
+    ("Sohar", "Oman"): "Sohar",
+    ("Nizwa", "Oman"): "Nizwa",
+    ("Al Buraimi", "Oman"): "Al Buraimi",
+    ("Sur", "Oman"): "Sur",
+    # Thailand cities
+    ("Bangkok", "Thailand"): "Bangkok",
+    ("Chiang Mai", "Thailand"): "Chiang Mai",
+    ("Phuket", "Thailand"): "Phuket",
+    ("Pattaya", "Thailand"): "Chonburi",
+    ("Hat Yai", "Thailand"): "Songkhla",
+    ("Nakhon Ratchasima", "Thailand"): "Nakhon Ratchasima",
+    ("Udon Thani", "Thailand"): "Udon Thani",
+    ("Khon Kaen", "Thailand"): "Khon Kaen",
+    ("Nakhon Si Thammarat", "Thailand"): "Nakhon Si Thammarat",
+    ("Ubon Ratchathani", "Thailand"): "Ubon Ratchathani",
+}
+
+
+# Country names in local languages mapped to English
+COUNTRY_MAPPINGS = {
+    # Thai
+    'ประเทศไทย': 'Thailand',
+    'ไทย': 'Thailand',
+    
+    # Chinese
+    '中国': 'China',
+    '中華人民共和國': 'China',
+    
+    # Japanese
+    '日本': 'Japan',
+    
+    # Korean
+    '대한민국': 'South Korea',
+    '한국': 'South Korea',
+    
+    # Arabic
+    'مصر': 'Egypt',
+    'السعودية': 'Saudi Arabia',
+    'قطر': 'Qatar',
+    'الإمارات': 'United Arab Emirates',
+    'الكويت': 'Kuwait',
+    'البحرين': 'Bahrain',
+    'عمان': 'Oman',
+    'الأردن': 'Jordan',
+    'لبنان': 'Lebanon',
+    'سوريا': 'Syria',
+    'العراق': 'Iraq',
+    'اليمن': 'Yemen',
+    
+    # Russian
+    'Россия': 'Russia',
+    'Российская Федерация': 'Russia',
+    
+    # German
+    'Deutschland': 'Germany',
+    
+    # French
+    'France': 'France',  # Already in English
+    'Espagne': 'Spain',
+    'Italie': 'Italy',
+    
+    # Spanish
+    'España': 'Spain',
+    'México': 'Mexico',
+    'Argentina': 'Argentina',
+    
+    # Portuguese
+    'Brasil': 'Brazil',
+    'Portugal': 'Portugal',
+    
+    # Other common variations
+    'USA': 'United States',
+    'US': 'United States',
+    'United States of America': 'United States',
+    'UK': 'United Kingdom',
+    'Great Britain': 'United Kingdom',
+    'England': 'United Kingdom',
+    'UAE': 'United Arab Emirates',
+    'U.A.E.': 'United Arab Emirates',
+    'U.A.E': 'United Arab Emirates',
+}
+
+# State/province names in local languages mapped to English
+STATE_MAPPINGS = {
+    # Indian states (Hindi/Devanagari)
+    'दिल्ली': 'Delhi',
+    'महाराष्ट्र': 'Maharashtra',
+    'पश्चिम बंगाल': 'West Bengal',
+    'तमिलनाडु': 'Tamil Nadu',
+    'कर्नाटक': 'Karnataka',
+    'तेलंगाना': 'Telangana',
+    'आंध्र प्रदेश': 'Andhra Pradesh',
+    'गुजरात': 'Gujarat',
+    'राजस्थान': 'Rajasthan',
+    'उत्तर प्रदेश': 'Uttar Pradesh',
+    'मध्य प्रदेश': 'Madhya Pradesh',
+    'बिहार': 'Bihar',
+    'ओडिशा': 'Odisha',
+    'पंजाब': 'Punjab',
+    'हरियाणा': 'Haryana',
+    'झारखंड': 'Jharkhand',
+    'छत्तीसगढ़': 'Chhattisgarh',
+    'असम': 'Assam',
+    'केरल': 'Kerala',
+    'उत्तराखंड': 'Uttarakhand',
+    'हिमाचल प्रदेश': 'Himachal Pradesh',
+    'त्रिपुरा': 'Tripura',
+    'मणिपुर': 'Manipur',
+    'मेघालय': 'Meghalaya',
+    'नगालैंड': 'Nagaland',
+    'अरुणाचल प्रदेश': 'Arunachal Pradesh',
+    'मिजोरम': 'Mizoram',
+    'सिक्किम': 'Sikkim',
+    'गोवा': 'Goa',
+    'दादरा और नगर हवेली': 'Dadra and Nagar Haveli',
+    'दमन और दीव': 'Daman and Diu',
+    'लक्षद्वीप': 'Lakshadweep',
+    'अंडमान और निकोबार द्वीप समूह': 'Andaman and Nicobar Islands',
+    'चंडीगढ़': 'Chandigarh',
+    'जम्मू और कश्मीर': 'Jammu and Kashmir',
+    'लद्दाख': 'Ladakh',
+    
+    # Thai provinces
+    'จังหวัดชลบุรี': 'Chonburi',
+    'จังหวัดกรุงเทพมหานคร': 'Bangkok',
+    'จังหวัดเชียงใหม่': 'Chiang Mai',
+    'จังหวัดภูเก็ต': 'Phuket',
+    'จังหวัดพัทยา': 'Pattaya',
+    'จังหวัดกระบี่': 'Krabi',
+    'จังหวัดสุราษฎร์ธานี': 'Surat Thani',
+    'จังหวัดนครศรีธรรมราช': 'Nakhon Si Thammarat',
+    'จังหวัดสงขลา': 'Songkhla',
+    'จังหวัดปัตตานี': 'Pattani',
+    'จังหวัดยะลา': 'Yala',
+    'จังหวัดนราธิวาส': 'Narathiwat',
+    'จังหวัดตรัง': 'Trang',
+    'จังหวัดพังงา': 'Phang Nga',
+    'จังหวัดระนอง': 'Ranong',
+    'จังหวัดชุมพร': 'Chumphon',
+    'จังหวัดนครปฐม': 'Nakhon Pathom',
+    'จังหวัดสมุทรปราการ': 'Samut Prakan',
+    'จังหวัดสมุทรสาคร': 'Samut Sakhon',
+    'จังหวัดสมุทรสงคราม': 'Samut Songkhram',
+    'จังหวัดนครนายก': 'Nakhon Nayok',
+    'จังหวัดปราจีนบุรี': 'Prachinburi',
+    'จังหวัดฉะเชิงเทรา': 'Chachoengsao',
+    'จังหวัดชัยนาท': 'Chainat',
+    'จังหวัดลพบุรี': 'Lopburi',
+    'จังหวัดสิงห์บุรี': 'Singburi',
+    'จังหวัดอ่างทอง': 'Ang Thong',
+    'จังหวัดพระนครศรีอยุธยา': 'Phra Nakhon Si Ayutthaya',
+    'จังหวัดสุพรรณบุรี': 'Suphanburi',
+    'จังหวัดกาญจนบุรี': 'Kanchanaburi',
+    'จังหวัดราชบุรี': 'Ratchaburi',
+    'จังหวัดเพชรบุรี': 'Phetchaburi',
+    'จังหวัดประจวบคีรีขันธ์': 'Prachuap Khiri Khan',
+    'จังหวัดนครสวรรค์': 'Nakhon Sawan',
+    'จังหวัดอุทัยธานี': 'Uthai Thani',
+    'จังหวัดกำแพงเพชร': 'Kamphaeng Phet',
+    'จังหวัดตาก': 'Tak',
+    'จังหวัดสุโขทัย': 'Sukhothai',
+    'จังหวัดพิษณุโลก': 'Phitsanulok',
+    'จังหวัดเพชรบูรณ์': 'Phetchabun',
+    'จังหวัดพิจิตร': 'Phichit',
+    'จังหวัดนครราชสีมา': 'Nakhon Ratchasima',
+    'จังหวัดบุรีรัมย์': 'Buriram',
+    'จังหวัดสุรินทร์': 'Surin',
+    'จังหวัดศรีสะเกษ': 'Sisaket',
+    'จังหวัดอุบลราชธานี': 'Ubon Ratchathani',
+    'จังหวัดยโสธร': 'Yasothon',
+    'จังหวัดชัยภูมิ': 'Chaiyaphum',
+    'จังหวัดอำนาจเจริญ': 'Amnat Charoen',
+    
+    # Arabic states/provinces
+    'القاهرة': 'Cairo',
+    'الإسكندرية': 'Alexandria',
+    'الأقصر': 'Luxor',
+    'أسوان': 'Aswan',
+    'شرم الشيخ': 'Sharm El Sheikh',
+    'จังหวัดหนองบัวลำภู': 'Nong Bua Lamphu',
+    'จังหวัดขอนแก่น': 'Khon Kaen',
+    'จังหวัดอุดรธานี': 'Udon Thani',
+    'จังหวัดเลย': 'Loei',
+    'จังหวัดหนองคาย': 'Nong Khai',
+    'จังหวัดมหาสารคาม': 'Maha Sarakham',
+    'จังหวัดร้อยเอ็ด': 'Roi Et',
+    'จังหวัดกาฬสินธุ์': 'Kalasin',
+    'จังหวัดสกลนคร': 'Sakon Nakhon',
+    'จังหวัดนครพนม': 'Nakhon Phanom',
+    'จังหวัดมุกดาหาร': 'Mukdahan',
+    'จังหวัดบึงกาฬ': 'Bueng Kan',
+    'จังหวัดเชียงราย': 'Chiang Rai',
+    'จังหวัดพะเยา': 'Phayao',
+    'จังหวัดน่าน': 'Nan',
+    'จังหวัดแพร่': 'Phrae',
+    'จังหวัดลำปาง': 'Lampang',
+    'จังหวัดอุตรดิตถ์': 'Uttaradit',
+    'จังหวัดแม่ฮ่องสอน': 'Mae Hong Son',
+    'จังหวัดลำพูน': 'Lamphun',
+    
+    # Chinese provinces/states
+    '广东省': 'Guangdong',
+    '北京市': 'Beijing',
+    '上海市': 'Shanghai',
+    '天津市': 'Tianjin',
+    '重庆市': 'Chongqing',
+    '河北省': 'Hebei',
+    '山西省': 'Shanxi',
+    '辽宁省': 'Liaoning',
+    '吉林省': 'Jilin',
+    '黑龙江省': 'Heilongjiang',
+    '江苏省': 'Jiangsu',
+    '浙江省': 'Zhejiang',
+    '安徽省': 'Anhui',
+    '福建省': 'Fujian',
+    '江西省': 'Jiangxi',
+    '山东省': 'Shandong',
+    '河南省': 'Henan',
+    '湖北省': 'Hubei',
+    '湖南省': 'Hunan',
+    '四川省': 'Sichuan',
+    '贵州省': 'Guizhou',
+    '云南省': 'Yunnan',
+    '陕西省': 'Shaanxi',
+    '甘肃省': 'Gansu',
+    '青海省': 'Qinghai',
+    '台湾省': 'Taiwan',
+    '内蒙古自治区': 'Inner Mongolia',
+    '广西壮族自治区': 'Guangxi',
+    '西藏自治区': 'Tibet',
+    '宁夏回族自治区': 'Ningxia',
+    '新疆维吾尔自治区': 'Xinjiang',
+    '香港特别行政区': 'Hong Kong',
+    '澳门特别行政区': 'Macau',
+    
+    # Japanese prefectures
+    '東京都': 'Tokyo',
+    '大阪府': 'Osaka',
+    '京都府': 'Kyoto',
+    '北海道': 'Hokkaido',
+    '神奈川県': 'Kanagawa',
+    '愛知県': 'Aichi',
+    '埼玉県': 'Saitama',
+    '千葉県': 'Chiba',
+    '兵庫県': 'Hyogo',
+    '福岡県': 'Fukuoka',
+    '静岡県': 'Shizuoka',
+    '茨城県': 'Ibaraki',
+    '広島県': 'Hiroshima',
+    '群馬県': 'Gunma',
+    '栃木県': 'Tochigi',
+    '岐阜県': 'Gifu',
+    '新潟県': 'Niigata',
+    '長野県': 'Nagano',
+    '三重県': 'Mie',
+    '福島県': 'Fukushima',
+    '山梨県': 'Yamanashi',
+    '滋賀県': 'Shiga',
+    '岡山県': 'Okayama',
+    '山口県': 'Yamaguchi',
+    '愛媛県': 'Ehime',
+    '奈良県': 'Nara',
+    '和歌山県': 'Wakayama',
+    '鳥取県': 'Tottori',
+    '島根県': 'Shimane',
+    '高知県': 'Kochi',
+    '徳島県': 'Tokushima',
+    '香川県': 'Kagawa',
+    '富山県': 'Toyama',
+    '石川県': 'Ishikawa',
+    '福井県': 'Fukui',
+    '山形県': 'Yamagata',
+    '秋田県': 'Akita',
+    '青森県': 'Aomori',
+    '岩手県': 'Iwate',
+    '宮城県': 'Miyagi',
+    '佐賀県': 'Saga',
+    '長崎県': 'Nagasaki',
+    '熊本県': 'Kumamoto',
+    '大分県': 'Oita',
+    '宮崎県': 'Miyazaki',
+    '鹿児島県': 'Kagoshima',
+    '沖縄県': 'Okinawa',
+    
+    # Korean provinces
+    '서울특별시': 'Seoul',
+    '부산광역시': 'Busan',
+    '대구광역시': 'Daegu',
+    '인천광역시': 'Incheon',
+    '광주광역시': 'Gwangju',
+    '대전광역시': 'Daejeon',
+    '울산광역시': 'Ulsan',
+    '세종특별자치시': 'Sejong',
+    '경기도': 'Gyeonggi',
+    '강원도': 'Gangwon',
+    '충청북도': 'Chungcheongbuk',
+    '충청남도': 'Chungcheongnam',
+    '전라북도': 'Jeollabuk',
+    '전라남도': 'Jeollanam',
+    '경상북도': 'Gyeongsangbuk',
+    '경상남도': 'Gyeongsangnam',
+    '제주특별자치도': 'Jeju',
+    
+    # Arabic states/provinces
+    'مكة المكرمة': 'Makkah',
+    'المدينة المنورة': 'Madinah',
+    'الشرقية': 'Eastern Province',
+    'القصيم': 'Qassim',
+    'الباحة': 'Baha',
+    'عسير': 'Asir',
+    'الحدود الشمالية': 'Northern Borders',
+}
+
+# City names in local languages mapped to English
+CITY_MAPPINGS = {
+    # Indian cities (Hindi/Devanagari)
+    'नई दिल्ली': 'New Delhi',
+    'मुंबई': 'Mumbai',
+    'कोलकाता': 'Kolkata',
+    'चेन्नई': 'Chennai',
+    'बैंगलोर': 'Bangalore',
+    'हैदराबाद': 'Hyderabad',
+    'अहमदाबाद': 'Ahmedabad',
+    'पुणे': 'Pune',
+    'जयपुर': 'Jaipur',
+    'लखनऊ': 'Lucknow',
+    'कानपुर': 'Kanpur',
+    'नागपुर': 'Nagpur',
+    'इंदौर': 'Indore',
+    'थाणे': 'Thane',
+    'भोपाल': 'Bhopal',
+    'विशाखापत्तनम': 'Visakhapatnam',
+    'पटना': 'Patna',
+    'वडोदरा': 'Vadodara',
+    'घाटकोपर': 'Ghatkopar',
+    'लुधियाना': 'Ludhiana',
+    'आगरा': 'Agra',
+    'नाशिक': 'Nashik',
+    'फरीदाबाद': 'Faridabad',
+    'मेरठ': 'Meerut',
+    'राजकोट': 'Rajkot',
+    'कलकत्ता': 'Kolkata',
+    'मद्रास': 'Chennai',
+    'बॉम्बे': 'Mumbai',
+    
+    # Thai cities
+    'กรุงเทพมหานคร': 'Bangkok',
+    'เชียงใหม่': 'Chiang Mai',
+    'ภูเก็ต': 'Phuket',
+    'พัทยา': 'Pattaya',
+    'หาดใหญ่': 'Hat Yai',
+    'นครราชสีมา': 'Nakhon Ratchasima',
+    'ขอนแก่น': 'Khon Kaen',
+    'อุบลราชธานี': 'Ubon Ratchathani',
+    'นครศรีธรรมราช': 'Nakhon Si Thammarat',
+    'สงขลา': 'Songkhla',
+    
+    # Chinese cities
+    '北京': 'Beijing',
+    '上海': 'Shanghai',
+    '广州': 'Guangzhou',
+    '深圳': 'Shenzhen',
+    '天津': 'Tianjin',
+    '重庆': 'Chongqing',
+    '成都': 'Chengdu',
+    '杭州': 'Hangzhou',
+    '南京': 'Nanjing',
+    '武汉': 'Wuhan',
+    '西安': 'Xian',
+    '青岛': 'Qingdao',
+    '大连': 'Dalian',
+    '厦门': 'Xiamen',
+    '苏州': 'Suzhou',
+    '无锡': 'Wuxi',
+    '宁波': 'Ningbo',
+    '长沙': 'Changsha',
+    '郑州': 'Zhengzhou',
+    '济南': 'Jinan',
+    
+    # Japanese cities
+    '東京': 'Tokyo',
+    '大阪': 'Osaka',
+    '京都': 'Kyoto',
+    '横浜': 'Yokohama',
+    '名古屋': 'Nagoya',
+    '神戸': 'Kobe',
+    '福岡': 'Fukuoka',
+    '札幌': 'Sapporo',
+    '仙台': 'Sendai',
+    '広島': 'Hiroshima',
+    '岡山': 'Okayama',
+    '金沢': 'Kanazawa',
+    '奈良': 'Nara',
+    '鎌倉': 'Kamakura',
+    '箱根': 'Hakone',
+    
+    # Korean cities
+    '서울': 'Seoul',
+    '부산': 'Busan',
+    '대구': 'Daegu',
+    '인천': 'Incheon',
+    '광주': 'Gwangju',
+    '대전': 'Daejeon',
+    '울산': 'Ulsan',
+    '수원': 'Suwon',
+    '창원': 'Changwon',
+    '고양': 'Goyang',
+    '용인': 'Yongin',
+    '성남': 'Seongnam',
+    '부천': 'Bucheon',
+    '안산': 'Ansan',
+    '전주': 'Jeonju',
+    '청주': 'Cheongju',
+    '포항': 'Pohang',
+    '춘천': 'Chuncheon',
+    '강릉': 'Gangneung',
+    '여수': 'Yeosu',
+    
+    # Arabic cities (names shared with states are in ARABIC_PLACE_MAPPINGS)
+    'الكويت': 'Kuwait City',
+    'عمان': 'Amman',
+    'بيروت': 'Beirut',
+    'دمشق': 'Damascus',
+    'بغداد': 'Baghdad',
+    'صنعاء': 'Sanaa',
+}
+
+
+# Arabic place names used both as states/provinces and as cities
+ARABIC_PLACE_MAPPINGS = {
+    # Saudi Arabia
+    'الرياض': 'Riyadh',
+    'جدة': 'Jeddah',
+    'مكة': 'Makkah',
+    'المدينة': 'Madinah',
+    'الدمام': 'Dammam',
+    'الخبر': 'Khobar',
+    'الظهران': 'Dhahran',
+    'تبوك': 'Tabuk',
+    'حائل': 'Hail',
+    'بريدة': 'Buraidah',
+    'الطائف': 'Taif',
+    'أبها': 'Abha',
+    'جازان': 'Jazan',
+    'نجران': 'Najran',
+    'الجوف': 'Jouf',
+    # Qatar
+    'الدوحة': 'Doha',
+    'الوكرة': 'Al Wakrah',
+    'الخور': 'Al Khor',
+    'الريان': 'Al Rayyan',
+    'أم صلال': 'Umm Salal',
+    'الظعاين': 'Al Daayen',
+    'الشحانية': 'Al Shamal',
+    # UAE
+    'دبي': 'Dubai',
+    'أبو ظبي': 'Abu Dhabi',
+    'الشارقة': 'Sharjah',
+    'العين': 'Al Ain',
+    'أم القيوين': 'Umm Al Quwain',
+    'رأس الخيمة': 'Ras Al Khaimah',
+    'الفجيرة': 'Fujairah',
+    'عجمان': 'Ajman',
+    # Kuwait
+    'حولي': 'Hawally',
+    'الجهراء': 'Al Jahra',
+    'مبارك الكبير': 'Mubarak Al Kabeer',
+    'الأحمدي': 'Al Ahmadi',
+    'الفروانية': 'Al Farwaniyah',
+    # Bahrain
+    'المنامة': 'Manama',
+    'المحرق': 'Muharraq',
+    'الرفاع': 'Riffa',
+    'مدينة عيسى': 'Isa Town',
+    'مدينة حمد': 'Hamad Town',
+    'الدراز': 'Dar Kulaib',
+    # Oman
+    'مسقط': 'Muscat',
+    'صلالة': 'Salalah',
+    'صحار': 'Sohar',
+    'نزوى': 'Nizwa',
+    'البريمي': 'Al Buraimi',
+    'صور': 'Sur',
+    # Jordan
+    'إربد': 'Irbid',
+    'الزرقاء': 'Zarqa',
+    'العقبة': 'Aqaba',
+    'السلط': 'Salt',
+    'الكرك': 'Karak',
+    # Lebanon
+    'طرابلس': 'Tripoli',
+    'صيدا': 'Sidon',
+    'بعلبك': 'Baalbek',
+    'جبيل': 'Byblos',
+    'زحلة': 'Zahle',
+    # Syria
+    'حلب': 'Aleppo',
+    'حمص': 'Homs',
+    'حماة': 'Hama',
+    'اللاذقية': 'Latakia',
+    'دير الزور': 'Deir ez-Zor',
+    # Iraq
+    'البصرة': 'Basra',
+    'الموصل': 'Mosul',
+    'أربيل': 'Erbil',
+    'السليمانية': 'Sulaymaniyah',
+    'النجف': 'Najaf',
+    # Yemen
+    'عدن': 'Aden',
+    'تعز': 'Taiz',
+    'الحديدة': 'Al Hudaydah',
+    'إب': 'Ibb',
+    'ذمار': 'Dhamar',
+}
+
+
+# Country codes returned by Geocodio (US and Canada only)
+PROVIDER_COUNTRY_CODES = {
+    'US': 'United States',
+    'CA': 'Canada',
+}
+
+# State and province codes returned by batch providers, keyed by
+# (country code, state code)
+PROVIDER_STATE_CODES = {
+    ('US', 'AL'): 'Alabama',
+    ('US', 'AK'): 'Alaska',
+    ('US', 'AZ'): 'Arizona',
+    ('US', 'AR'): 'Arkansas',
+    ('US', 'CA'): 'California',
+    ('US', 'CO'): 'Colorado',
+    ('US', 'CT'): 'Connecticut',
+    ('US', 'DE'): 'Delaware',
+    ('US', 'DC'): 'District of Columbia',
+    ('US', 'FL'): 'Florida',
+    ('US', 'GA'): 'Georgia',
+    ('US', 'HI'): 'Hawaii',
+    ('US', 'ID'): 'Idaho',
+    ('US', 'IL'): 'Illinois',
+    ('US', 'IN'): 'Indiana',
+    ('US', 'IA'): 'Iowa',
+    ('US', 'KS'): 'Kansas',
+    ('US', 'KY'): 'Kentucky',
+    ('US', 'LA'): 'Louisiana',
+    ('US', 'ME'): 'Maine',
+    ('US', 'MD'): 'Maryland',
+    ('US', 'MA'): 'Massachusetts',
+    ('US', 'MI'): 'Michigan',
+    ('US', 'MN'): 'Minnesota',
+    ('US', 'MS'): 'Mississippi',
+    ('US', 'MO'): 'Missouri',
+    ('US', 'MT'): 'Montana',
+    ('US', 'NE'): 'Nebraska',
+    ('US', 'NV'): 'Nevada',
+    ('US', 'NH'): 'New Hampshire',
+    ('US', 'NJ'): 'New Jersey',
+    ('US', 'NM'): 'New Mexico',
+    ('US', 'NY'): 'New York',
+    ('US', 'NC'): 'North Carolina',
+    ('US', 'ND'): 'North Dakota',
+    ('US', 'OH'): 'Ohio',
+    ('US', 'OK'): 'Oklahoma',
+    ('US', 'OR'): 'Oregon',
+    ('US', 'PA'): 'Pennsylvania',
+    ('US', 'RI'): 'Rhode Island',
+    ('US', 'SC'): 'South Carolina',
+    ('US', 'SD'): 'South Dakota',
+    ('US', 'TN'): 'Tennessee',
+    ('US', 'TX'): 'Texas',
+    ('US', 'UT'): 'Utah',
+    ('US', 'VT'): 'Vermont',
+    ('US', 'VA'): 'Virginia',
+    ('US', 'WA'): 'Washington',
+    ('US', 'WV'): 'West Virginia',
+    ('US', 'WI'): 'Wisconsin',
+    ('US', 'WY'): 'Wyoming',
+    ('US', 'AS'): 'American Samoa',
+    ('US', 'GU'): 'Guam',
+    ('US', 'MP'): 'Northern Mariana Islands',
+    ('US', 'PR'): 'Puerto Rico',
+    ('US', 'VI'): 'United States Virgin Islands',
+    ('CA', 'AB'): 'Alberta',
+    ('CA', 'BC'): 'British Columbia',
+    ('CA', 'MB'): 'Manitoba',
+    ('CA', 'NB'): 'New Brunswick',
+    ('CA', 'NL'): 'Newfoundland and Labrador',
+    ('CA', 'NS'): 'Nova Scotia',
+    ('CA', 'NT'): 'Northwest Territories',
+    ('CA', 'NU'): 'Nunavut',
+    ('CA', 'ON'): 'Ontario',
+    ('CA', 'PE'): 'Prince Edward Island',
+    ('CA', 'QC'): 'Québec',
+    ('CA', 'SK'): 'Saskatchewan',
+    ('CA', 'YT'): 'Yukon',
+}
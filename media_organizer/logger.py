@@ -5,7 +5,10 @@ This module provides centralized logging functionality with configurable
 log levels and output formats.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
@@ -16,6 +19,27 @@ except ImportError:
     TQDM_AVAILABLE = False
     logging.warning("tqdm not available. Progress bars will be disabled.")
 
+# Maximum number of log records waiting for the listener thread
+LOG_QUEUE_SIZE = 10000
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves all record formatting to the listener thread.
+    
+    The stock QueueHandler formats each record before enqueueing it, and
+    drops records with an error when a bounded queue is full. Records here
+    stay in-process, so they are queued as-is and producers block while the
+    queue is full instead of losing messages.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        self.queue.put(record)
+
+
 
 class Logger:
     """
@@ -35,10 +59,17 @@ class Logger:
         """
         self.log_level = getattr(logging, log_level.upper(), logging.INFO)
         self.log_file = log_file
+        self._listener = None
         self._setup_logging()
     
     def _setup_logging(self):
-        """Set up logging configuration."""
+        """
+        Set up logging configuration.
+        
+        Console and file handlers run on a QueueListener thread; the root
+        logger only enqueues records, so worker threads never wait on
+        formatting or stream I/O.
+        """
         # Create formatter
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -51,23 +82,38 @@ class Logger:
         
         # Clear existing handlers
         root_logger.handlers.clear()
+        handlers = []
         
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(self.log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # File handler (if specified)
+        file_error = None
         if self.log_file:
             try:
                 file_handler = logging.FileHandler(self.log_file, mode='w')
                 file_handler.setLevel(self.log_level)
                 file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
-                logging.info(f"Logging to file: {self.log_file}")
+                handlers.append(file_handler)
             except Exception as e:
-                logging.error(f"Failed to set up file logging: {e}")
+                file_error = e
+        
+        # Emit records from a single background thread
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        root_logger.addHandler(_DeferredQueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.shutdown)
+        
+        if file_error is not None:
+            logging.error(f"Failed to set up file logging: {file_error}")
+        elif self.log_file:
+            logging.info(f"Logging to file: {self.log_file}")
         
         # Set specific logger levels
         logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -75,6 +121,12 @@ class Logger:
         
         logging.info("Logging system initialized")
     
+    def shutdown(self):
+        """Flush queued log records and stop the listener thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+    
     def get_logger(self, name: str) -> logging.Logger:
         """
         Get a logger instance for a specific module.
@@ -8,11 +8,11 @@ process, including file scanning, GPS extraction, geocoding, and file organizati
 import os
 import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .metadata_extractor import MetadataExtractor
-from .geocoder import Geocoder
+from .geocoder import Geocoder, BATCH_PROVIDERS
 from .file_organizer import FileOrganizer
 from .logger import Logger
 
@@ -25,18 +25,26 @@ class MediaOrganizer:
     and manages the overall workflow.
     """
     
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, batch_backend: Optional[Dict[str, Any]] = None):
         """
         Initialize the media organizer application.
         
         Args:
             max_workers: Maximum number of worker threads for concurrent processing
+            batch_backend: Optional batch geocoder settings (provider, endpoint,
+                api_key, batch_size) to geocode many coordinates per request;
+                provider is "geocodio" (default) or "mapbox"
         """
         self.logger = Logger()
         self.log = self.logger.get_logger(__name__)
         
         self.metadata_extractor = MetadataExtractor()
-        self.geocoder = Geocoder()
+        if batch_backend:
+            settings = dict(batch_backend)
+            provider = settings.pop('provider', 'geocodio')
+            self.geocoder = BATCH_PROVIDERS[provider](**settings)
+        else:
+            self.geocoder = Geocoder()
         self.file_organizer = None
         self.max_workers = max_workers
         
@@ -47,7 +55,8 @@ class MediaOrganizer:
         Get user input for source directory, destination directory, operation type, and mode.
         
         Returns:
-            Tuple of (source_dir, dest_dir, operation, mode)
+            Tuple of (source_dir, dest_dir, operation, mode, max_workers,
+            folder_structure, link_duplicates)
         """
         print("\n" + "="*60)
         print("MEDIA ORGANIZER")
@@ -122,7 +131,20 @@ class MediaOrganizer:
                 except ValueError:
                     print("Error: Please enter a valid number.")
         
-        return source_dir, dest_dir, operation, mode, max_workers, folder_structure
+        # Get duplicate linking option (only for execute mode)
+        link_duplicates = False
+        if mode == "execute":
+            while True:
+                link_input = input("Hardlink files already in the destination instead of copying them (y/n, default n): ").strip().lower()
+                if link_input in ['', 'n', 'no']:
+                    break
+                elif link_input in ['y', 'yes']:
+                    link_duplicates = True
+                    break
+                else:
+                    print("Error: Please enter 'y' or 'n'.")
+        
+        return source_dir, dest_dir, operation, mode, max_workers, folder_structure, link_duplicates
     
     def plan_organization(self, source_dir: str, dest_dir: str, folder_structure: str = "city") -> bool:
         """
@@ -142,7 +164,7 @@ class MediaOrganizer:
             
             # Scan for media files
             self.log.info(f"Scanning directory: {source_dir}")
-            media_files = self.file_organizer.scan_directory(source_dir)
+            media_files = self.file_organizer.scan_directory(source_dir, workers=self.max_workers)
             
             if not media_files:
                 self.log.warning("No media files found in the source directory.")
@@ -412,7 +434,8 @@ class MediaOrganizer:
             self.log.error(f"Error during planning: {e}")
             return False
     
-    def process_files(self, source_dir: str, dest_dir: str, operation: str, folder_structure: str = "city") -> bool:
+    def process_files(self, source_dir: str, dest_dir: str, operation: str, folder_structure: str = "city",
+                      link_duplicates: bool = False) -> bool:
         """
         Process all media files in the source directory.
         
@@ -421,17 +444,23 @@ class MediaOrganizer:
             dest_dir: Destination directory path
             operation: Operation type ('copy' or 'move')
             folder_structure: "state" for Country/State or "city" for Country/State/City
+            link_duplicates: Index the destination first and hardlink files
+                whose content is already there instead of copying them
             
         Returns:
             True if successful, False otherwise
         """
         try:
             # Initialize file organizer
-            self.file_organizer = FileOrganizer(dest_dir, folder_structure)
+            self.file_organizer = FileOrganizer(dest_dir, folder_structure, link_duplicates=link_duplicates)
+            
+            # Index files already in the destination so duplicates can be linked
+            if link_duplicates:
+                self.file_organizer.build_destination_index()
             
             # Scan for media files
             self.log.info(f"Scanning directory: {source_dir}")
-            media_files = self.file_organizer.scan_directory(source_dir)
+            media_files = self.file_organizer.scan_directory(source_dir, workers=self.max_workers)
             
             if not media_files:
                 self.log.warning("No media files found in the source directory.")
@@ -693,16 +722,12 @@ class MediaOrganizer:
                 
                 progress_bar = self.logger.create_progress_bar(len(files_without_gps), "Processing non-GPS files")
                 
-                for file_path in files_without_gps:
-                    try:
-                        success = self.file_organizer.organize_file(file_path, "Unknown", "Unknown", "Unknown", operation)
-                        if success:
-                            successful_operations += 1
-                            no_gps_files += 1
-                        else:
-                            failed_operations += 1
-                    except Exception as e:
-                        self.log.error(f"Error processing {file_path}: {e}")
+                items = [(file_path, "Unknown", "Unknown", "Unknown") for file_path in files_without_gps]
+                for _, success, _ in self.file_organizer.organize_batch(items, operation, workers=self.max_workers):
+                    if success:
+                        successful_operations += 1
+                        no_gps_files += 1
+                    else:
                         failed_operations += 1
                     
                     if progress_bar:
@@ -711,6 +736,10 @@ class MediaOrganizer:
                 if progress_bar:
                     progress_bar.close()
             
+            # Keep the digests computed this run for the next one
+            if link_duplicates:
+                self.file_organizer.save_destination_index()
+            
             # Get skipped files count
             skipped_files_count = self.file_organizer.get_skipped_files_count()
             
@@ -729,10 +758,14 @@ class MediaOrganizer:
             
             # Show cache statistics
             cache_stats = self.geocoder.get_cache_stats()
-            self.log.info(f"Geocoding cache: {cache_stats['cache_hits']} hits, {cache_stats['cache_misses']} misses ({cache_stats['hit_rate_percent']}% hit rate)")
+            self.log.info(f"Geocoding cache: {cache_stats['cache_hits']} hits, {cache_stats['cache_misses']} misses ({cache_stats['hit_rate_percent']}% hit rate), "
+                          f"name normalizing: {cache_stats['normalize_cache_hits']} hits, "
+                          f"{cache_stats['normalize_cache_misses']} misses")
             
             dir_cache_stats = self.file_organizer.get_directory_cache_stats()
-            self.log.info(f"Directory cache: {dir_cache_stats['cached_directories']} directories cached")
+            self.log.info(f"Directory cache: {dir_cache_stats['cached_directories']} directories cached, "
+                          f"name sanitizing: {dir_cache_stats['sanitize_cache_hits']} hits, "
+                          f"{dir_cache_stats['sanitize_cache_misses']} misses")
             
             return failed_operations == 0
             
@@ -822,7 +855,8 @@ class MediaOrganizer:
         
         # Take random samples for better distribution
         remaining_count = sample_size - len(systematic_samples)
-        remaining_coords = [coord for coord in coordinates if coord not in systematic_samples]
+        systematic_set = set(systematic_samples)
+        remaining_coords = [coord for coord in coordinates if coord not in systematic_set]
         random_samples = random.sample(remaining_coords, min(remaining_count, len(remaining_coords)))
         
         # Combine and deduplicate
@@ -886,7 +920,7 @@ class MediaOrganizer:
         """
         try:
             # Get user input
-            source_dir, dest_dir, operation, mode, max_workers, folder_structure = self.get_user_input()
+            source_dir, dest_dir, operation, mode, max_workers, folder_structure, link_duplicates = self.get_user_input()
             
             # Update max_workers for this session
             self.max_workers = max_workers
@@ -900,6 +934,7 @@ class MediaOrganizer:
             print(f"Folder structure: {folder_structure}")
             if mode == "execute":
                 print(f"Concurrent workers: {max_workers}")
+                print(f"Link duplicates: {'yes' if link_duplicates else 'no'}")
             
             confirm = input("\nProceed? (y/n): ").strip().lower()
             if confirm not in ['y', 'yes']:
@@ -914,7 +949,7 @@ class MediaOrganizer:
                 else:
                     print("\nPlanning completed with some errors. Check the log for details.")
             else:  # execute mode
-                success = self.process_files(source_dir, dest_dir, operation, folder_structure)
+                success = self.process_files(source_dir, dest_dir, operation, folder_structure, link_duplicates)
                 if success:
                     print("\nOperation completed successfully!")
                 else:
@@ -929,6 +964,8 @@ class MediaOrganizer:
             self.log.error(f"Unexpected error: {e}")
             print(f"\nAn unexpected error occurred: {e}")
             return False
+        finally:
+            self.geocoder.close()
 
 
 def main():
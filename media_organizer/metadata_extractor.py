@@ -8,7 +8,6 @@ Supports various image formats (JPEG, PNG, etc.) and video formats.
 import os
 import logging
 from typing import Optional, Tuple, Dict, Any
-from pathlib import Path
 
 try:
     from PIL import Image
@@ -34,6 +33,49 @@ except ImportError:
     logging.warning("hachoir not available. Video metadata extraction will be limited.")
 
 
+def _convert_dms_to_decimal(gps_info: Dict[str, Any], coord_key: str, ref_key: str) -> Optional[float]:
+    """
+    Convert degrees/minutes/seconds to decimal coordinates.
+    
+    Args:
+        gps_info: GPS information dictionary
+        coord_key: Key for the coordinate value
+        ref_key: Key for the coordinate reference (N/S, E/W)
+        
+    Returns:
+        Decimal coordinate value, None if conversion fails
+    """
+    if coord_key not in gps_info:
+        return None
+    
+    coord = gps_info[coord_key]
+    ref = gps_info.get(ref_key, 'N')
+    
+    if isinstance(coord, (list, tuple)) and len(coord) >= 3:
+        degrees = float(coord[0])
+        minutes = float(coord[1])
+        seconds = float(coord[2])
+        
+        decimal = degrees + (minutes / 60.0) + (seconds / 3600.0)
+        
+        if ref in ['S', 'W']:
+            decimal = -decimal
+        
+        return decimal
+    elif isinstance(coord, str):
+        # Handle string format coordinates
+        try:
+            # Simple decimal format
+            decimal = float(coord)
+            if ref in ['S', 'W']:
+                decimal = -decimal
+            return decimal
+        except ValueError:
+            pass
+    
+    return None
+
+
 class MetadataExtractor:
     """
     Extracts GPS metadata from media files.
@@ -43,10 +85,31 @@ class MetadataExtractor:
     """
     
     # Supported image extensions
-    IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp'}
+    IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp'})
     
     # Supported video extensions  
-    VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp'}
+    VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp'})
+    
+    # Common GPS tag names in ffprobe video metadata, in lookup order
+    _FFPROBE_GPS_TAGS = (
+        'location', 'gps', 'geo', 'coordinates',
+        'latitude', 'longitude', 'lat', 'lon', 'lng',
+        'gps_latitude', 'gps_longitude',
+        'com.apple.quicktime.location.ISO6709',  # iOS location format
+        'com.apple.quicktime.location',  # iOS location
+    )
+    
+    # Common GPS field names in hachoir video metadata
+    _VIDEO_GPS_FIELDS = (
+        'latitude', 'longitude', 'lat', 'lon', 'lng',
+        'gps_latitude', 'gps_longitude', 'gps_lat', 'gps_lon',
+        'location_latitude', 'location_longitude',
+        'geo_latitude', 'geo_longitude'
+    )
+    _VIDEO_LOCATION_FIELDS = ('location', 'geo', 'gps', 'coordinates')
+    _VIDEO_COMMENT_FIELDS = ('comment', 'description', 'title', 'subject')
+    _VIDEO_LAT_FIELDS = ('lat', 'gps_lat', 'gps_latitude', 'location_latitude', 'geo_latitude')
+    _VIDEO_LON_FIELDS = ('lon', 'lng', 'gps_lon', 'gps_longitude', 'location_longitude', 'geo_longitude')
     
     def __init__(self):
         """Initialize the metadata extractor."""
@@ -68,7 +131,7 @@ class MetadataExtractor:
         Returns:
             True if the file is a supported media file, False otherwise
         """
-        file_ext = Path(file_path).suffix.lower()
+        file_ext = os.path.splitext(file_path)[1].lower()
         return file_ext in self.IMAGE_EXTENSIONS or file_ext in self.VIDEO_EXTENSIONS
     
     def extract_gps_coordinates(self, file_path: str) -> Optional[Tuple[float, float]]:
@@ -82,17 +145,17 @@ class MetadataExtractor:
             Tuple of (latitude, longitude) if GPS data is found, None otherwise
         """
         if not os.path.exists(file_path):
-            self.logger.error(f"File does not exist: {file_path}")
+            self.logger.error("File does not exist: %s", file_path)
             return None
         
-        file_ext = Path(file_path).suffix.lower()
+        file_ext = os.path.splitext(file_path)[1].lower()
         
         if file_ext in self.IMAGE_EXTENSIONS:
             return self._extract_gps_from_image(file_path)
         elif file_ext in self.VIDEO_EXTENSIONS:
             return self._extract_gps_from_video(file_path)
         else:
-            self.logger.warning(f"Unsupported file type: {file_path}")
+            self.logger.warning("Unsupported file type: %s", file_path)
             return None
     
     def has_gps_data(self, file_path: str) -> bool:
@@ -109,7 +172,7 @@ class MetadataExtractor:
         if not os.path.exists(file_path):
             return False
         
-        file_ext = Path(file_path).suffix.lower()
+        file_ext = os.path.splitext(file_path)[1].lower()
         
         # For images, check file size and basic EXIF presence
         if file_ext in self.IMAGE_EXTENSIONS:
@@ -218,7 +281,7 @@ class MetadataExtractor:
                         if gps_data:
                             return gps_data
             except Exception as e:
-                self.logger.debug(f"PIL extraction failed for {file_path}: {e}")
+                self.logger.debug("PIL extraction failed for %s: %s", file_path, e)
         
         # Fallback to exifread
         if EXIFREAD_AVAILABLE:
@@ -229,9 +292,9 @@ class MetadataExtractor:
                     if gps_data:
                         return gps_data
             except Exception as e:
-                self.logger.debug(f"exifread extraction failed for {file_path}: {e}")
+                self.logger.debug("exifread extraction failed for %s: %s", file_path, e)
         
-        self.logger.debug(f"No GPS data found in image: {file_path}")
+        self.logger.debug("No GPS data found in image: %s", file_path)
         return None
     
     def _extract_gps_from_video(self, file_path: str) -> Optional[Tuple[float, float]]:
@@ -245,19 +308,19 @@ class MetadataExtractor:
             Tuple of (latitude, longitude) if GPS data is found, None otherwise
         """
         if not HACHOIR_AVAILABLE:
-            self.logger.debug(f"Video metadata extraction not available for: {file_path}")
+            self.logger.debug("Video metadata extraction not available for: %s", file_path)
             return None
         
         try:
             parser = createParser(file_path)
             if not parser:
-                self.logger.debug(f"Could not create parser for video: {file_path}")
+                self.logger.debug("Could not create parser for video: %s", file_path)
                 return None
             
             with parser:
                 metadata = extractMetadata(parser)
                 if not metadata:
-                    self.logger.debug(f"No metadata found in video: {file_path}")
+                    self.logger.debug("No metadata found in video: %s", file_path)
                     return None
                 
                 # Try to extract GPS data from video metadata
@@ -271,9 +334,9 @@ class MetadataExtractor:
                     return gps_data
                 
         except Exception as e:
-            self.logger.debug(f"Video metadata extraction failed for {file_path}: {e}")
+            self.logger.debug("Video metadata extraction failed for %s: %s", file_path, e)
         
-        self.logger.debug(f"No GPS data found in video: {file_path}")
+        self.logger.debug("No GPS data found in video: %s", file_path)
         return None
     
     def _try_alternative_video_gps_extraction(self, file_path: str) -> Optional[Tuple[float, float]]:
@@ -290,7 +353,7 @@ class MetadataExtractor:
             # Try using ffprobe if available (for more detailed video metadata)
             return self._extract_gps_with_ffprobe(file_path)
         except Exception as e:
-            self.logger.debug(f"Alternative video GPS extraction failed for {file_path}: {e}")
+            self.logger.debug("Alternative video GPS extraction failed for %s: %s", file_path, e)
         
         return None
     
@@ -336,9 +399,9 @@ class MetadataExtractor:
                                 
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError, 
                 FileNotFoundError, json.JSONDecodeError) as e:
-            self.logger.debug(f"ffprobe extraction failed for {file_path}: {e}")
+            self.logger.debug("ffprobe extraction failed for %s: %s", file_path, e)
         except Exception as e:
-            self.logger.debug(f"Unexpected error in ffprobe extraction for {file_path}: {e}")
+            self.logger.debug("Unexpected error in ffprobe extraction for %s: %s", file_path, e)
         
         return None
     
@@ -352,22 +415,13 @@ class MetadataExtractor:
         Returns:
             Tuple of (latitude, longitude) if GPS data is found, None otherwise
         """
-        # Common GPS tag names in video metadata
-        gps_tags = [
-            'location', 'gps', 'geo', 'coordinates',
-            'latitude', 'longitude', 'lat', 'lon', 'lng',
-            'gps_latitude', 'gps_longitude',
-            'com.apple.quicktime.location.ISO6709',  # iOS location format
-            'com.apple.quicktime.location',  # iOS location
-        ]
-        
-        for tag_name in gps_tags:
+        for tag_name in self._FFPROBE_GPS_TAGS:
             if tag_name in tags:
                 value = tags[tag_name]
                 if isinstance(value, str):
                     coords = self._parse_location_string(value)
                     if coords:
-                        self.logger.debug(f"Found GPS data in ffprobe tag '{tag_name}': {value}")
+                        self.logger.debug("Found GPS data in ffprobe tag '%s': %s", tag_name, value)
                         return coords
         
         return None
@@ -425,31 +479,22 @@ class MetadataExtractor:
             # Try to get GPS coordinates from various metadata fields
             gps_data = {}
             
-            # Common GPS field names in video metadata
-            gps_fields = [
-                'latitude', 'longitude', 'lat', 'lon', 'lng',
-                'gps_latitude', 'gps_longitude', 'gps_lat', 'gps_lon',
-                'location_latitude', 'location_longitude',
-                'geo_latitude', 'geo_longitude'
-            ]
-            
             # Check for direct GPS fields
-            for field in gps_fields:
+            for field in self._VIDEO_GPS_FIELDS:
                 try:
                     value = getattr(metadata, field, None)
                     if value is not None:
                         gps_data[field] = value
-                        self.logger.debug(f"Found GPS field '{field}': {value}")
+                        self.logger.debug("Found GPS field '%s': %s", field, value)
                 except Exception:
                     continue
             
             # Try to extract from location fields
-            location_fields = ['location', 'geo', 'gps', 'coordinates']
-            for field in location_fields:
+            for field in self._VIDEO_LOCATION_FIELDS:
                 try:
                     value = getattr(metadata, field, None)
                     if value is not None:
-                        self.logger.debug(f"Found location field '{field}': {value}")
+                        self.logger.debug("Found location field '%s': %s", field, value)
                         # Try to parse location string
                         coords = self._parse_location_string(str(value))
                         if coords:
@@ -458,12 +503,11 @@ class MetadataExtractor:
                     continue
             
             # Try to extract from comment or description fields
-            comment_fields = ['comment', 'description', 'title', 'subject']
-            for field in comment_fields:
+            for field in self._VIDEO_COMMENT_FIELDS:
                 try:
                     value = getattr(metadata, field, None)
                     if value and isinstance(value, str):
-                        self.logger.debug(f"Checking comment field '{field}': {value}")
+                        self.logger.debug("Checking comment field '%s': %s", field, value)
                         coords = self._parse_location_string(value)
                         if coords:
                             return coords
@@ -480,13 +524,10 @@ class MetadataExtractor:
                     pass
             
             # Try alternative field combinations
-            lat_fields = ['lat', 'gps_lat', 'gps_latitude', 'location_latitude', 'geo_latitude']
-            lon_fields = ['lon', 'lng', 'gps_lon', 'gps_longitude', 'location_longitude', 'geo_longitude']
-            
             lat = None
             lon = None
             
-            for field in lat_fields:
+            for field in self._VIDEO_LAT_FIELDS:
                 if field in gps_data:
                     try:
                         lat = float(gps_data[field])
@@ -494,7 +535,7 @@ class MetadataExtractor:
                     except (ValueError, TypeError):
                         continue
             
-            for field in lon_fields:
+            for field in self._VIDEO_LON_FIELDS:
                 if field in gps_data:
                     try:
                         lon = float(gps_data[field])
@@ -511,7 +552,7 @@ class MetadataExtractor:
                     try:
                         value = getattr(metadata, key, None)
                         if value and isinstance(value, str):
-                            self.logger.debug(f"Checking metadata field '{key}': {value}")
+                            self.logger.debug("Checking metadata field '%s': %s", key, value)
                             coords = self._parse_location_string(value)
                             if coords:
                                 return coords
@@ -519,7 +560,7 @@ class MetadataExtractor:
                         continue
                         
         except Exception as e:
-            self.logger.debug(f"Error extracting GPS from video metadata: {e}")
+            self.logger.debug("Error extracting GPS from video metadata: %s", e)
         
         return None
     
@@ -575,7 +616,7 @@ class MetadataExtractor:
                     return (lat, lon)
                     
         except Exception as e:
-            self.logger.debug(f"Error parsing location string '{location_str}': {e}")
+            self.logger.debug("Error parsing location string '%s': %s", location_str, e)
         
         return None
     
@@ -590,55 +631,12 @@ class MetadataExtractor:
             Tuple of (latitude, longitude) in decimal format, None if conversion fails
         """
         try:
-            lat = self._convert_dms_to_decimal(gps_info, 'GPSLatitude', 'GPSLatitudeRef')
-            lon = self._convert_dms_to_decimal(gps_info, 'GPSLongitude', 'GPSLongitudeRef')
+            lat = _convert_dms_to_decimal(gps_info, 'GPSLatitude', 'GPSLatitudeRef')
+            lon = _convert_dms_to_decimal(gps_info, 'GPSLongitude', 'GPSLongitudeRef')
             
             if lat is not None and lon is not None:
                 return (lat, lon)
         except Exception as e:
-            self.logger.debug(f"Error converting GPS coordinates: {e}")
+            self.logger.debug("Error converting GPS coordinates: %s", e)
         
         return None
-    
-    def _convert_dms_to_decimal(self, gps_info: Dict[str, Any], 
-                               coord_key: str, ref_key: str) -> Optional[float]:
-        """
-        Convert degrees/minutes/seconds to decimal coordinates.
-        
-        Args:
-            gps_info: GPS information dictionary
-            coord_key: Key for the coordinate value
-            ref_key: Key for the coordinate reference (N/S, E/W)
-            
-        Returns:
-            Decimal coordinate value, None if conversion fails
-        """
-        if coord_key not in gps_info:
-            return None
-        
-        coord = gps_info[coord_key]
-        ref = gps_info.get(ref_key, 'N')
-        
-        if isinstance(coord, (list, tuple)) and len(coord) >= 3:
-            degrees = float(coord[0])
-            minutes = float(coord[1])
-            seconds = float(coord[2])
-            
-            decimal = degrees + (minutes / 60.0) + (seconds / 3600.0)
-            
-            if ref in ['S', 'W']:
-                decimal = -decimal
-            
-            return decimal
-        elif isinstance(coord, str):
-            # Handle string format coordinates
-            try:
-                # Simple decimal format
-                decimal = float(coord)
-                if ref in ['S', 'W']:
-                    decimal = -decimal
-                return decimal
-            except ValueError:
-                pass
-        
-        return None 
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+Tests for copying, moving and duplicate linking in FileOrganizer.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from media_organizer.file_organizer import FileOrganizer, INDEX_FILENAME
+
+
+def write_file(path: str, data: bytes) -> str:
+    """Create a file (and its parent directories) with the given content."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def read_file(path: str) -> bytes:
+    """Return the content of a file."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class OrganizeBatchTest(unittest.TestCase):
+    """organize_batch copies, moves and skips files in a temporary tree."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source = os.path.join(tmp.name, 'source')
+        self.destination = os.path.join(tmp.name, 'destination')
+        self.files = {
+            name: write_file(os.path.join(self.source, 'sub', name), os.urandom(4096 + i))
+            for i, name in enumerate(['a.jpg', 'b.png', 'c.mp4'])
+        }
+        self.location_dir = os.path.join(self.destination, 'India', 'Maharashtra', 'Mumbai')
+
+    def organize(self, organizer: FileOrganizer, operation: str) -> list:
+        records = organizer.scan_directory(self.source, workers=2)
+        items = [(record, 'India', 'Maharashtra', 'Mumbai') for record in records]
+        return [success for _, success, _ in organizer.organize_batch(items, operation, workers=2)]
+
+    def test_copy_then_skip(self):
+        originals = {name: read_file(path) for name, path in self.files.items()}
+
+        organizer = FileOrganizer(self.destination)
+        self.assertEqual(self.organize(organizer, 'copy'), [True] * 3)
+        for name, path in self.files.items():
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(read_file(os.path.join(self.location_dir, name)), originals[name])
+        self.assertEqual(organizer.get_skipped_files_count(), 0)
+
+        # A second run finds every name taken and copies nothing
+        organizer = FileOrganizer(self.destination)
+        self.assertEqual(self.organize(organizer, 'copy'), [True] * 3)
+        self.assertEqual(organizer.get_skipped_files_count(), 3)
+        self.assertEqual(sorted(os.listdir(self.location_dir)), sorted(self.files))
+
+    def test_move(self):
+        originals = {name: read_file(path) for name, path in self.files.items()}
+
+        organizer = FileOrganizer(self.destination)
+        self.assertEqual(self.organize(organizer, 'move'), [True] * 3)
+        for name, path in self.files.items():
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(read_file(os.path.join(self.location_dir, name)), originals[name])
+
+    def test_move_does_not_clobber(self):
+        existing = write_file(os.path.join(self.location_dir, 'a.jpg'), b'already here')
+
+        organizer = FileOrganizer(self.destination, strict_compare=True)
+        self.assertEqual(self.organize(organizer, 'move'), [True] * 3)
+        self.assertEqual(read_file(existing), b'already here')
+        self.assertTrue(os.path.exists(self.files['a.jpg']))
+        self.assertFalse(os.path.exists(self.files['b.png']))
+        self.assertEqual(organizer.get_skipped_files_count(), 1)
+
+
+class DestinationIndexTest(unittest.TestCase):
+    """Files already in the destination are hardlinked instead of copied."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source = os.path.join(tmp.name, 'source')
+        self.destination = os.path.join(tmp.name, 'destination')
+        self.data = os.urandom(64 * 1024)
+        self.existing = write_file(os.path.join(self.destination, 'Old', 'original.jpg'), self.data)
+        write_file(os.path.join(self.source, 'copy.jpg'), self.data)
+        write_file(os.path.join(self.source, 'other.jpg'), os.urandom(64 * 1024))
+
+    def test_duplicates_are_linked(self):
+        probe = os.path.join(self.destination, 'probe')
+        try:
+            os.link(self.existing, probe)
+        except OSError:
+            self.skipTest("hard links are not supported in the temporary directory")
+        os.unlink(probe)
+
+        organizer = FileOrganizer(self.destination, link_duplicates=True)
+        self.assertEqual(organizer.build_destination_index(), 1)
+
+        records = organizer.scan_directory(self.source)
+        items = [(record, 'Unknown', 'Unknown', 'Unknown') for record in records]
+        results = [success for _, success, _ in organizer.organize_batch(items, 'copy', workers=2)]
+        self.assertEqual(results, [True, True])
+
+        location_dir = os.path.join(self.destination, 'Unknown')
+        linked = os.path.join(location_dir, 'copy.jpg')
+        copied = os.path.join(location_dir, 'other.jpg')
+        self.assertTrue(os.path.samefile(linked, self.existing))
+        self.assertEqual(os.stat(linked).st_nlink, 2)
+        self.assertEqual(os.stat(copied).st_nlink, 1)
+
+        self.assertTrue(organizer.save_destination_index())
+        with open(os.path.join(self.destination, INDEX_FILENAME), encoding='utf-8') as f:
+            saved = json.load(f)
+        saved_paths = sorted(rel_path.replace(os.sep, '/') for rel_path, *_ in saved['files'])
+        self.assertEqual(saved_paths, ['Old/original.jpg', 'Unknown/copy.jpg', 'Unknown/other.jpg'])
+
+
+if __name__ == '__main__':
+    unittest.main()
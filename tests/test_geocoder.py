@@ -0,0 +1,103 @@
+"""
+Tests for the persistent geocoding cache, one provider at a time.
+
+HTTP calls are replaced with canned responses, so no request leaves the machine.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import requests
+
+from media_organizer.geocoder import BatchGeocoder, Geocoder
+
+MUMBAI = (19.0760, 72.8777)
+MUMBAI_ADDRESS = {'country': 'India', 'state': 'Maharashtra', 'city': 'Mumbai'}
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, data, status_code: int = 200):
+        self.content = json.dumps(data).encode()
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(self.status_code)
+
+
+class CacheRoundTripTest(unittest.TestCase):
+    """Results written by one geocoder are read back by the next."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_path = os.path.join(tmp.name, 'geocoding.sqlite')
+        self.gets = 0
+        self.posts = 0
+        self.batch_status = 200
+
+    def fake_get(self, url, params=None, timeout=None):
+        self.gets += 1
+        return FakeResponse({'address': MUMBAI_ADDRESS})
+
+    def fake_post(self, url, params=None, json=None, timeout=None):
+        self.posts += 1
+        results = [{'query': query, 'response': {'results': [{'address_components': {
+            'country': 'India', 'state': 'Maharashtra', 'city': 'Pune'}}]}} for query in json]
+        return FakeResponse({'results': results}, self.batch_status)
+
+    def make_geocoder(self, geocoder_class=Geocoder, **kwargs) -> Geocoder:
+        geocoder = geocoder_class(cache_path=self.cache_path, **kwargs)
+        self.addCleanup(geocoder.close)
+        geocoder._session.get = self.fake_get
+        geocoder._session.post = self.fake_post
+        return geocoder
+
+    def make_batch_geocoder(self) -> BatchGeocoder:
+        return self.make_geocoder(BatchGeocoder, endpoint='http://batch.invalid', api_key='key',
+                                  requests_per_second=100)
+
+    def test_nominatim_round_trip(self):
+        first = self.make_geocoder()
+        self.assertEqual(first.reverse_geocode(*MUMBAI), ('India', 'Maharashtra', 'Mumbai'))
+        first.close()
+        self.assertEqual(self.gets, 1)
+
+        second = self.make_geocoder()
+        self.assertEqual(second.reverse_geocode(*MUMBAI), ('India', 'Maharashtra', 'Mumbai'))
+        self.assertEqual(self.gets, 1)
+
+    def test_batch_provider_round_trip(self):
+        first = self.make_batch_geocoder()
+        self.assertEqual(first.batch_reverse_geocode([MUMBAI]), {MUMBAI: ('India', 'Maharashtra', 'Pune')})
+        first.close()
+        self.assertEqual(self.posts, 1)
+
+        second = self.make_batch_geocoder()
+        self.assertEqual(second.batch_reverse_geocode([MUMBAI]), {MUMBAI: ('India', 'Maharashtra', 'Pune')})
+        second.close()
+        self.assertEqual(self.posts, 1)
+
+        # Nominatim does not answer from another provider's results
+        nominatim = self.make_geocoder()
+        self.assertEqual(nominatim.reverse_geocode(*MUMBAI), ('India', 'Maharashtra', 'Mumbai'))
+        self.assertEqual(self.gets, 1)
+
+    def test_batch_reuses_nominatim_fallback(self):
+        self.batch_status = 500
+        first = self.make_batch_geocoder()
+        self.assertEqual(first.batch_reverse_geocode([MUMBAI]), {MUMBAI: ('India', 'Maharashtra', 'Mumbai')})
+        first.close()
+        self.assertEqual((self.posts, self.gets), (1, 1))
+
+        second = self.make_batch_geocoder()
+        self.assertEqual(second.batch_reverse_geocode([MUMBAI]), {MUMBAI: ('India', 'Maharashtra', 'Mumbai')})
+        self.assertEqual((self.posts, self.gets), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()